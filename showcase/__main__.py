@@ -33,7 +33,7 @@ class Main(Application):
 
     async def load(self) -> None:
         Frame(self, title='Loaded').title_style(Color.WARNING()).grid(2)
-        self.render()
+        self.request_render()
 
     async def launch_modal(self, event: Event) -> None:
         self.modal = Modal(
@@ -49,7 +49,7 @@ class Main(Application):
         if self.modal:
             self.remove(self.modal)
             self.modal = None
-            self.render()
+            self.request_render()
 
 
 if __name__ == '__main__':
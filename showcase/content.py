@@ -38,4 +38,4 @@ class Content(Frame):
 
     async def on_content_click(self, event: Event) -> None:
         self.right.content = f'Clicked on: y={event.y:03d}, x={event.x:03d}'
-        self.right.render()
+        self.right.request_render()
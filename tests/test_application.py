@@ -1,9 +1,11 @@
+import os
 import inspect
 import curses
 import asyncio
 from types import MethodType
+from collections import deque
 from pytest import mark, fixture, raises
-from widark.application import Application
+from widark.application import Application, PASTE
 from widark.widget import Widget, Event
 
 
@@ -58,6 +60,7 @@ def test_application_build(application):
 async def test_application_run(application, monkeypatch):
     start_screen_called = False
     connect_called = False
+    update_called = False
     doupdate_called = False
     stop_screen_called = False
 
@@ -73,9 +76,14 @@ async def test_application_run(application, monkeypatch):
         nonlocal connect_called
         connect_called = True
 
+    def mock_update(self) -> None:
+        nonlocal update_called
+        update_called = True
+
     def mock_doupdate() -> None:
         nonlocal doupdate_called
         doupdate_called = True
+        application.active = False
 
     def mock_stop_screen(self) -> None:
         nonlocal stop_screen_called
@@ -83,6 +91,7 @@ async def test_application_run(application, monkeypatch):
 
     application._start_screen = MethodType(mock_start_screen, application)
     application.connect = MethodType(mock_connect, application)
+    application.update = MethodType(mock_update, application)
     monkeypatch.setattr(curses, "doupdate", mock_doupdate)
     application._stop_screen = MethodType(mock_stop_screen, application)
 
@@ -90,6 +99,7 @@ async def test_application_run(application, monkeypatch):
 
     assert start_screen_called is True
     assert connect_called is True
+    assert update_called is True
     assert doupdate_called is True
     assert stop_screen_called is True
 
@@ -106,10 +116,106 @@ def test_application_read(application):
 
     application.window = MockWindow()
 
-    key, buffer = application._read()
+    queue = application._read()
+
+    assert list(queue) == [(ord('A'), None), (ord('B'), None)]
+    assert application.metrics == {'peak': 2, 'dropped': 0}
+
+
+def test_application_read_mouse(application, monkeypatch):
+    motion = curses.REPORT_MOUSE_POSITION
+    reports = [(0, 1, 1, 0, motion), (0, 2, 2, 0, motion),
+               (0, 3, 3, 0, curses.BUTTON1_CLICKED), (0, 4, 4, 0, motion)]
+
+    class MockWindow:
+        def __init__(self) -> None:
+            self.values = [curses.KEY_MOUSE] * 4 + [ord('A'), -1]
+
+        def getch(self):
+            return self.values.pop(0)
+
+    monkeypatch.setattr(curses, "getmouse", lambda: reports.pop(0))
+    application.window = MockWindow()
+
+    queue = application._read()
 
-    assert key == ord('A')
-    assert buffer == [ord('A'), ord('B')]
+    assert list(queue) == [
+        (curses.KEY_MOUSE, (0, 2, 2, 0, motion)),
+        (curses.KEY_MOUSE, (0, 3, 3, 0, curses.BUTTON1_CLICKED)),
+        (curses.KEY_MOUSE, (0, 4, 4, 0, motion)),
+        (ord('A'), None)]
+
+
+def test_application_read_bounded(application):
+    class MockWindow:
+        def __init__(self) -> None:
+            self.values = [ord(character) for character in 'ABCDE'] + [-1]
+
+        def getch(self):
+            return self.values.pop(0)
+
+    application._queue = deque(maxlen=3)
+    application.window = MockWindow()
+
+    queue = application._read()
+
+    assert list(queue) == [(ord('C'), None), (ord('D'), None),
+                           (ord('E'), None)]
+    assert application.metrics == {'peak': 3, 'dropped': 2}
+
+
+def test_application_read_bracketed_paste(application):
+    class MockWindow:
+        def __init__(self, values) -> None:
+            self.values = values + [-1]
+
+        def getch(self):
+            return self.values.pop(0)
+
+    start, end = b'\x1b[200~', b'\x1b[201~'
+    text = 'ñandú\nline'.encode('utf-8')
+
+    application.window = MockWindow([ord('A'), *start, *text[:4]])
+    queue = application._read()
+
+    assert list(queue) == [(ord('A'), None)]
+
+    queue.clear()
+    application.window = MockWindow([*text[4:], *end, 27, ord('x'), 27])
+    queue = application._read()
+
+    assert list(queue) == [(PASTE, 'ñandú\nline'), (27, None),
+                           (ord('x'), None), (27, None)]
+
+
+async def test_application_process_paste(application, monkeypatch):
+    events = []
+
+    async def mock_dispatch(self, event: Event):
+        events.append(event)
+
+    monkeypatch.setattr(curses, "getsyx", lambda: (2, 3))
+    application._capture = MethodType(
+        lambda self, event: application, application)
+    application.dispatch = MethodType(mock_dispatch, application)
+
+    await application._process(PASTE, 'añ\n')
+
+    assert [(event.type, event.data, event.y, event.x)
+            for event in events] == [
+        ('keydown', 'a', 2, 3), ('keydown', 'ñ', 2, 3),
+        ('keydown', '\n', 2, 3)]
+
+    async def on_paste(event: Event):
+        pass
+
+    events.clear()
+    application.listen('paste', on_paste)
+
+    await application._process(PASTE, 'pasted\ntext')
+
+    assert [(event.type, event.data, event.y, event.x)
+            for event in events] == [('paste', 'pasted\ntext', 2, 3)]
 
 
 async def test_application_not_active(application):
@@ -152,7 +258,7 @@ async def test_application_process(application):
     application.render = MethodType(mock_render, application)
     application._clear_screen = MethodType(mock_clear_screen, application)
 
-    await application._process(curses.KEY_RESIZE, [curses.KEY_RESIZE])
+    await application._process(curses.KEY_RESIZE)
 
     assert render_called is True
     assert clear_screen_called is True
@@ -220,7 +326,7 @@ async def test_application_process_mouse_events(application, monkeypatch):
     application._capture = MethodType(mock_capture, application)
     application.dispatch = MethodType(mock_dispatch, application)
 
-    await application._process(curses.KEY_MOUSE, [curses.KEY_MOUSE])
+    await application._process(curses.KEY_MOUSE)
 
     assert getmouse_called is True
     assert getattr(capture_event, 'y') == 10
@@ -251,7 +357,7 @@ async def test_application_process_keyboard_events(application, monkeypatch):
     application._capture = MethodType(mock_capture, application)
     application.dispatch = MethodType(mock_dispatch, application)
 
-    await application._process(ord('W'), [ord('W')])
+    await application._process(ord('W'))
 
     assert getmouse_called is True
     assert getattr(capture_event, 'category') == 'Keyboard'
@@ -259,3 +365,121 @@ async def test_application_process_keyboard_events(application, monkeypatch):
     assert getattr(capture_event, 'y') == 8
     assert getattr(capture_event, 'x') == 4
     assert capture_event is dispatch_event
+
+
+async def test_application_reactive_wait_input(application):
+    reader, writer = os.pipe()
+    application.reactive = True
+    application._stream = os.fdopen(reader)
+
+    application._listen()
+    await asyncio.wait_for(application._wait(), 1 / 5)
+    application._dirty = False
+
+    waiting = asyncio.ensure_future(application._wait())
+    await asyncio.sleep(1 / 50)
+    assert waiting.done() is False
+
+    os.write(writer, b'A')
+    await asyncio.wait_for(waiting, 1 / 5)
+    os.read(reader, 1)
+
+    application._unlisten()
+    os.close(writer)
+    application._stream.close()
+
+    assert application._signal is None
+
+
+async def test_application_reactive_wait_render_request(application):
+    reader, writer = os.pipe()
+    application.reactive = True
+    application._stream = os.fdopen(reader)
+    application.build()
+
+    application._listen()
+    await asyncio.wait_for(application._wait(), 1 / 5)
+
+    for widget in [application, application.first, application.third]:
+        widget._dirty = widget._pending = False
+
+    waiting = asyncio.ensure_future(application._wait())
+    await asyncio.sleep(1 / 50)
+    assert waiting.done() is False
+
+    application.third.request_render()
+    await asyncio.wait_for(waiting, 1 / 5)
+
+    application._unlisten()
+    os.close(writer)
+    application._stream.close()
+
+
+async def test_application_reactive_idle_timeout(application):
+    application.reactive = True
+    application._idle = 1 / 50
+    application._signal = asyncio.Event()
+
+    await asyncio.wait_for(application._wait(), 1 / 5)
+
+    assert application._signal.is_set() is False
+
+
+async def test_application_process_queue_in_order(application, monkeypatch):
+    keys = []
+
+    class MockWindow:
+        def __init__(self) -> None:
+            self.values = [ord('A'), ord('B'), ord('C'), -1]
+
+        def getch(self):
+            return self.values.pop(0) if self.values else -1
+
+    async def mock_dispatch(self, event: Event):
+        keys.append((event.key, event.data))
+
+    def mock_connect(self):
+        return self
+
+    async def mock_wait(self):
+        await asyncio.sleep(0)
+        if not self.window.values:
+            self.active = False
+
+    monkeypatch.setattr(curses, "getsyx", lambda: (0, 0))
+    monkeypatch.setattr(curses, "doupdate", lambda: None)
+    application._start_screen = MethodType(
+        lambda self: setattr(self, 'window', MockWindow()), application)
+    application._stop_screen = MethodType(lambda self: None, application)
+    application.connect = MethodType(mock_connect, application)
+    application.update = MethodType(mock_connect, application)
+    application._wait = MethodType(mock_wait, application)
+    application.dispatch = MethodType(mock_dispatch, application)
+
+    await application._run()
+
+    assert keys == [('A', 'A'), ('B', 'B'), ('C', 'C')]
+
+
+async def test_application_capture_fixed_overlay(application):
+    application.active = False
+    original_stop_screen = application._stop_screen
+    application._stop_screen = MethodType(lambda self: None, application)
+
+    await application._run()
+
+    overlay = Widget(application, position='fixed').pin(10, 20, 8, 30)
+    application.render()
+
+    covered = application._capture(Event('Mouse', 'click', y=15, x=35))
+    uncovered = application._capture(Event('Mouse', 'click', y=20, x=35))
+
+    application.remove(overlay)
+    removed = application._capture(Event('Mouse', 'click', y=15, x=35))
+
+    application._stop_screen = original_stop_screen
+    application._stop_screen()
+
+    assert covered is overlay
+    assert uncovered is application.fourth
+    assert removed is application.fourth
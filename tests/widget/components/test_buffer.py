@@ -0,0 +1,179 @@
+import random
+from pytest import mark, raises
+from widark.widget.components.buffer import (
+    Buffer, DefaultBuffer, Rope, FileBuffer)
+
+
+def test_buffer_not_implemented():
+    buffer = Buffer()
+
+    with raises(NotImplementedError):
+        buffer.write(0, 0, 'text')
+
+    with raises(NotImplementedError):
+        buffer.delete(0, 0, 1)
+
+    with raises(NotImplementedError):
+        buffer.read()
+
+    with raises(NotImplementedError):
+        buffer.offset(0, 0)
+
+    with raises(NotImplementedError):
+        buffer.position(0)
+
+    with raises(NotImplementedError):
+        len(buffer)
+
+
+def test_default_buffer():
+    buffer = DefaultBuffer(['Hello', 'World'])
+
+    buffer.write(0, 5, ', dear\nold')
+    assert buffer == ['Hello, dear', 'old', 'World']
+
+    buffer.delete(0, 5, 7)
+    assert buffer == ['Helloold', 'World']
+
+    buffer.delete(1, 5, 3)
+    assert buffer.read() == 'Helloold\nWorld'
+    assert buffer.offset(1, 2) == 11
+    assert buffer.offset(1, 20) == 14
+    assert buffer.position(11) == (1, 2)
+    assert buffer.position(8) == (0, 8)
+
+
+def test_rope():
+    rope = Rope('Hello\nWorld', chunk=4)
+
+    assert len(rope) == 2
+    assert rope == ['Hello', 'World']
+    assert rope[1] == 'World'
+    assert rope[-1] == 'World'
+    assert rope[0:1] == ['Hello']
+
+    rope.write(0, 5, ', dear\nold')
+    assert list(rope) == ['Hello, dear', 'old', 'World']
+
+    rope.delete(0, 5, 7)
+    assert rope.read() == 'Helloold\nWorld'
+    assert rope.offset(1, 2) == 11
+    assert rope.position(11) == (1, 2)
+
+    with raises(IndexError):
+        rope[2]
+
+    assert Rope() == ['']
+
+
+def test_rope_matches_default_buffer():
+    generator = random.Random(7)
+    for _ in range(50):
+        text = ''.join(generator.choice('ab\n') for _ in range(
+            generator.randint(0, 200)))
+        rope = Rope(text, chunk=generator.choice([1, 4, 32]))
+        reference = DefaultBuffer(text.split('\n'))
+
+        for _ in range(40):
+            y = generator.randrange(len(reference))
+            x = generator.randint(0, len(reference[y]))
+            offset = generator.randint(0, len(reference.read()))
+
+            assert rope.offset(y, x) == reference.offset(y, x)
+            assert rope.position(offset) == reference.position(offset)
+            assert rope.length(y) == reference.length(y)
+            assert rope.excerpt(y, x - 1, x + 3) == reference.excerpt(
+                y, x - 1, x + 3)
+
+            if generator.random() < 0.5:
+                text = ''.join(generator.choice('xy\n') for _ in range(
+                    generator.randint(0, 10)))
+                rope.write(y, x, text)
+                reference.write(y, x, text)
+            else:
+                count = generator.randint(0, 10)
+                rope.delete(y, x, count)
+                reference.delete(y, x, count)
+
+            assert rope == reference
+
+
+def test_rope_long_line_edits():
+    rope = Rope('y' * 1_000_000)
+
+    for index in range(1000):
+        rope.write(0, 500_000, 'a')
+    rope.delete(0, 0, 10)
+
+    assert len(rope) == 1
+    assert rope.offset(0, 2_000_000) == 1_000_990
+    assert rope[0][499_990:499_992] == 'aa'
+    assert rope.length(0) == 1_000_990
+    assert rope.excerpt(0, 499_990, 499_992) == 'aa'
+
+    with raises(IndexError):
+        rope.length(1)
+
+
+@mark.asyncio
+async def test_file_buffer(tmp_path):
+    path = tmp_path / 'data.log'
+    path.write_bytes('first\nsegundo ñ\n\nlast'.encode('utf-8'))
+
+    buffer = FileBuffer(str(path), chunk=8)
+
+    assert buffer.complete is False
+    assert len(buffer) == 1
+    assert buffer[0] == 'first'
+
+    await buffer.load()
+
+    assert buffer.complete is True
+    assert buffer == ['first', 'segundo ñ', '', 'last']
+    assert buffer.offset(1, 3) == 9
+    assert buffer.position(9) == (1, 3)
+
+    buffer.write(1, 7, ' dos\ntres')
+    buffer.delete(0, 5, 1)
+
+    assert buffer.read() == 'firstsegundo dos\ntres ñ\n\nlast'
+    assert len(buffer.pieces) == 3
+    assert path.read_bytes() == 'first\nsegundo ñ\n\nlast'.encode('utf-8')
+
+    buffer.close()
+
+
+@mark.asyncio
+async def test_file_buffer_edit_while_loading(tmp_path):
+    path = tmp_path / 'data.log'
+    lines = [f'line {index}' for index in range(1000)]
+    path.write_text('\n'.join(lines) + '\n')
+
+    buffer = FileBuffer(str(path), chunk=64)
+    scanned = len(buffer)
+
+    assert 0 < scanned < 10
+
+    buffer.write(0, 0, '> ')
+    await buffer.load()
+
+    assert len(buffer) == 1001
+    assert buffer[0] == '> line 0'
+    assert buffer[999] == 'line 999'
+    assert buffer[-1] == ''
+    assert buffer.pieces[-1] == (None, 1, -1)
+
+    buffer.close()
+
+
+def test_file_buffer_empty(tmp_path):
+    path = tmp_path / 'empty.log'
+    path.write_bytes(b'')
+
+    buffer = FileBuffer(str(path))
+    buffer.write(0, 0, 'text')
+
+    assert buffer.complete is True
+    assert buffer == ['text']
+
+    buffer.close()
@@ -1,8 +1,11 @@
+import time
 import curses
 from pytest import mark, fixture
 from types import MethodType
 from widark.widget import Event
 from widark.widget.components.entry import Entry, Canvas
+from widark.widget.components.buffer import DefaultBuffer, Rope, FileBuffer
+from widark.widget.components.syntax import RegexTokenizer
 
 
 pytestmark = mark.asyncio
@@ -19,6 +22,7 @@ def test_canvas_instantiation_defaults(root):
     assert entry.canvas.content == ''
     assert len(entry.canvas._bubble_listeners['click']) == 1
     assert len(entry.canvas._bubble_listeners['keydown']) == 1
+    assert len(entry.canvas._bubble_listeners['paste']) == 1
 
 
 async def test_entry_on_click(root):
@@ -43,6 +47,62 @@ def test_entry_text(root):
     assert entry.text == content
 
 
+def test_entry_buffer(root):
+    entry = Entry(root, buffer=Rope('Hello\nWorld'))
+
+    assert isinstance(entry.canvas.buffer, Rope)
+    assert entry.canvas.buffer == ['Hello', 'World']
+    assert entry.text == 'Hello\nWorld'
+
+    entry.canvas.buffer = ['Other']
+
+    assert isinstance(entry.canvas.buffer, DefaultBuffer)
+    assert entry.text == 'Other'
+
+
+async def test_entry_rope_editing(root):
+    entry = Entry(root, buffer=Rope('Hello\nWorld', chunk=2),
+                  position='fixed').pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+
+    canvas.move(0, 5)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='\n'))
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='!', data='!'))
+    await canvas.dispatch(Event(
+        'Keyboard', 'keydown', key=chr(curses.KEY_BACKSPACE)))
+    await canvas.dispatch(Event(
+        'Keyboard', 'keydown', key=chr(curses.KEY_BACKSPACE)))
+    canvas.move(1, 0)
+    await canvas.dispatch(Event(
+        'Keyboard', 'keydown', key=chr(curses.KEY_DC)))
+
+    assert entry.text == 'Hello\norld'
+    assert canvas.content == 'Hello\norld\n'
+
+
+
+async def test_entry_rope_long_line_benchmark(root):
+    entry = Entry(root, buffer=Rope('{"key": "value"}, ' * 1_000_000),
+                  position='fixed').style(border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+    canvas.move(0, 0)
+
+    right = Event('Keyboard', 'keydown', key=chr(curses.KEY_RIGHT))
+    start = time.time()
+    for _ in range(200):
+        await canvas.dispatch(right)
+    for _ in range(200):
+        await canvas.dispatch(Event('Keyboard', 'keydown', key='x',
+                                    data='x'))
+    elapsed = time.time() - start
+
+    assert canvas.buffer.length(0) == 18_000_200
+    assert canvas.buffer.excerpt(0, 200, 202) == 'xx'
+    assert canvas.cursor() == (0, 27)
+    assert elapsed < 1
+
 @fixture
 def entry(root):
     content = (
@@ -473,3 +533,482 @@ async def test_entry_character(entry):
     await entry.canvas.dispatch(event)
 
     assert entry.canvas.buffer[0] == 'Z'
+
+
+async def test_entry_incremental_paint(entry):
+    canvas = entry.canvas
+    renders = []
+    rows = []
+
+    def render(self):
+        renders.append(True)
+        return Canvas.render(self)
+
+    window = canvas.window
+
+    class Window:
+        def __getattr__(self, name):
+            return getattr(window, name)
+
+        def addstr(self, y, x, *args):
+            rows.append(y)
+            return window.addstr(y, x, *args)
+
+    canvas.render = MethodType(render, canvas)
+    canvas.window = Window()
+
+    canvas.move(6, 0)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='A', data='A'))
+
+    assert renders == []
+    assert rows == [6]
+    assert window.instr(6, 0, 10).decode() == 'Amollis or'
+    assert canvas.content.splitlines()[6] == 'Amollis orci. Cras quis matti'
+
+    rows.clear()
+    canvas.move(6, 1)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='\n'))
+
+    assert renders == []
+    assert rows == [6, 7, 8, 9]
+    assert window.instr(7, 0, 10).decode() == 'mollis orc'
+    assert canvas.content.splitlines()[9] == 'Donec scelerisque nec tellus '
+
+    rows.clear()
+    canvas.move(7, 0)
+    await canvas.dispatch(Event(
+        'Keyboard', 'keydown', key=chr(curses.KEY_BACKSPACE)))
+
+    assert renders == []
+    assert rows == [6, 7, 8, 9]
+    assert window.instr(9, 0, 10).decode() == 'ut tincidu'
+
+    canvas.move(0, 28)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='W', data='W'))
+
+    assert renders == []
+    assert canvas._dirty is True
+
+    canvas.update()
+
+    assert renders == [True]
+
+
+async def test_entry_arrow_benchmark(root):
+    content = '\n'.join(f'line {index:05d} ' + 'x' * 40
+                        for index in range(10_001))
+    entry = Entry(root, content=content, position='fixed').style(
+        border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+    renders = []
+
+    def render(self):
+        renders.append(True)
+        return Canvas.render(self)
+
+    canvas.render = MethodType(render, canvas)
+    canvas.move(0, 5)
+
+    event = Event('Keyboard', 'keydown', key=chr(curses.KEY_DOWN))
+    start = time.perf_counter()
+    for _ in range(10_000):
+        await canvas.dispatch(event)
+    elapsed = time.perf_counter() - start
+
+    assert renders == []
+    assert canvas.cursor() == (9, 5)
+    assert canvas.base_y == 9_991
+    assert canvas.content.splitlines()[8] == 'line 09999 xxxxxxxxxxxxxxxxxx'
+    assert root.window.instr(9, 0, 10).decode() == 'line 10000'
+    assert elapsed < 5
+
+    event = Event('Keyboard', 'keydown', key=chr(curses.KEY_UP))
+    for _ in range(5):
+        await canvas.dispatch(event)
+
+    assert renders == []
+    assert canvas.cursor() == (4, 5)
+
+
+async def test_entry_paste(entry):
+    canvas = entry.canvas
+    renders = []
+
+    def render(self):
+        renders.append(True)
+        return Canvas.render(self)
+
+    canvas.render = MethodType(render, canvas)
+    canvas.move(1, 3)
+
+    await canvas.dispatch(Event('Keyboard', 'paste', data='XY'))
+
+    assert renders == []
+    assert canvas.buffer[1].startswith('ac XYfelis')
+    assert canvas.cursor() == (1, 5)
+
+    lines = [f'{index:06d}' + 'z' * 60 for index in range(20_000)]
+    canvas.move(2, 0)
+    canvas.paste('\r\n'.join(lines) + '\n')
+
+    assert renders == []
+    assert canvas._dirty is True
+
+    canvas.update()
+
+    assert renders == [True]
+    assert len(canvas.buffer) == 20_011
+    assert canvas.buffer[20_002] == (
+        'et quis elit. Quisque nec molestie lorem. Nunc sem est, vulputate')
+    assert canvas.base_y == 20_002 - 9
+    assert canvas.cursor() == (9, 0)
+    assert canvas.content.splitlines()[8].startswith('019999zz')
+
+
+async def test_entry_file_buffer(root, tmp_path):
+    path = tmp_path / 'data.log'
+    path.write_text('\n'.join(f'line {index}' for index in range(5000)))
+
+    buffer = FileBuffer(str(path), chunk=64)
+    entry = Entry(root, buffer=buffer, position='fixed').style(
+        border=[]).pin(0, 0, 10, 30)
+    root.render()
+
+    assert entry.canvas.content.splitlines()[:2] == ['line 0', 'line 1']
+
+    await entry.canvas.load()
+
+    assert len(entry.canvas.buffer) == 5000
+    assert entry.canvas._dirty is True
+
+    def linear(*arguments):
+        raise AssertionError('Paste walked the file prefix.')
+
+    canvas = entry.canvas
+    canvas.update()
+    buffer.offset = buffer.position = linear
+    canvas.base_y = 4990
+    canvas.update()
+    canvas.move(2, 4)
+    canvas.paste('A\nB')
+
+    assert buffer[4992] == 'lineA'
+    assert buffer[4993] == 'B 4992'
+    assert canvas.cursor() == (3, 1)
+
+    buffer.close()
+
+
+async def test_entry_find(entry):
+    canvas = entry.canvas
+
+    def position():
+        y, x = canvas.cursor()
+        return canvas.base_y + y, canvas.base_x + x
+
+    canvas.find('vitae').update()
+    await canvas._scan
+
+    assert canvas.search.total == 3
+    assert canvas.window.inch(3, 12) & curses.A_REVERSE
+    assert canvas.window.inch(3, 16) & curses.A_REVERSE
+    assert not canvas.window.inch(3, 11) & curses.A_REVERSE
+    assert not canvas.window.inch(3, 17) & curses.A_REVERSE
+
+    canvas.move(0, 0)
+    canvas.find_next()
+
+    assert position() == (1, 40)
+    assert canvas.base_x == 12
+
+    canvas.find_next()
+
+    assert position() == (3, 12)
+
+    canvas.find_next()
+    canvas.find_next()
+
+    assert position() == (1, 40)
+
+    canvas.find_next(reverse=True)
+
+    assert position() == (5, 35)
+
+    canvas.find(r'ma\w+', regex=True, ignorecase=True)
+
+    assert canvas.search.line(0) == [(57, 65)]
+
+
+async def test_entry_find_next_waits_for_scan(entry):
+    canvas = entry.canvas
+    canvas.move(0, 0)
+    canvas.find('vitae')
+    canvas.find_next()
+
+    assert canvas.search.complete is False
+    assert canvas.cursor() == (0, 0)
+
+    await canvas._jump
+
+    assert canvas.cursor() == (1, 28)
+    assert canvas.base_x == 12
+
+
+async def test_entry_find_tracks_edits(entry):
+    canvas = entry.canvas
+    canvas.find('vitae')
+    await canvas._scan
+    canvas.update()
+    search = canvas.search
+
+    matched = []
+    match = search._match
+    search._match = lambda sentence: matched.append(sentence) or match(
+        sentence)
+
+    canvas.move(2, 0)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='\n'))
+
+    assert matched == ['', 'et quis elit. Quisque nec molestie lorem.'
+                       ' Nunc sem est, vulputate']
+    assert search._cache[4] == [(12, 17)]
+    assert search._cache[1] == [(40, 45)]
+
+    matched.clear()
+    canvas.move(0, 0)
+    await canvas.dispatch(Event('Keyboard', 'paste', data='vitae '))
+
+    assert matched == ['vitae Lorem ipsum dolor sit amet, consectetur'
+                       ' adipiscing elit. Maecenas']
+    assert canvas.window.inch(0, 0) & curses.A_REVERSE
+    assert search.total == 4
+
+
+async def test_entry_syntax_highlighting(root):
+    content = '\n'.join(f'key{index}={index}' for index in range(5000))
+    tokenizer = RegexTokenizer(
+        rules=[(r'^\w+(?==)', curses.A_BOLD)],
+        blocks=[('#', '$', curses.A_UNDERLINE)])
+    entry = Entry(root, content=content, tokenizer=tokenizer,
+                  position='fixed').style(border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+
+    assert canvas.syntax.frontier == 10 + canvas.lookahead
+    assert canvas.window.inch(0, 0) & curses.A_BOLD
+    assert canvas.window.inch(0, 3) & curses.A_BOLD
+    assert not canvas.window.inch(0, 4) & curses.A_BOLD
+
+    renders = []
+
+    def render(self):
+        renders.append(True)
+        return Canvas.render(self)
+
+    canvas.render = MethodType(render, canvas)
+    canvas.move(2, 0)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='#', data='#'))
+
+    assert renders == []
+    assert canvas._dirty is False
+    assert canvas.cursor() == (2, 1)
+    assert canvas.syntax.tokens[2] == [(0, 7, curses.A_UNDERLINE)]
+    assert canvas.window.inch(2, 1) & curses.A_UNDERLINE
+    assert not canvas.window.inch(2, 1) & curses.A_BOLD
+    assert canvas.window.inch(3, 0) & curses.A_BOLD
+
+    canvas.find('key4000=')
+    await canvas._scan
+    canvas.find_next()
+    canvas.update()
+
+    assert canvas.base_y == 3995
+    assert canvas.cursor() == (5, 0)
+    assert canvas.syntax.frontier < canvas.base_y
+    assert not canvas.window.inch(6, 0) & curses.A_BOLD
+
+    await canvas._tokenize
+
+    assert canvas.syntax.frontier == 3995 + 10 + canvas.lookahead
+    assert canvas._dirty is True
+
+    canvas.update()
+
+    assert canvas.window.inch(6, 0) & curses.A_BOLD
+
+
+async def test_entry_wrap(root):
+    content = '\n'.join([
+        'Lorem ipsum dolor sit amet, consectetur adipiscing elit. Maecenas',
+        'short',
+        'ac felis enim. Praesent facilisis lacus vitae nunc posuere'] +
+        [f'line {index}' for index in range(20)])
+    entry = Entry(root, content=content, wrap=True,
+                  position='fixed').style(border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+
+    assert canvas.content.splitlines()[:6] == [
+        'Lorem ipsum dolor sit amet, ', 'consectetur adipiscing elit. ',
+        'Maecenas', 'short', 'ac felis enim. Praesent ',
+        'facilisis lacus vitae nunc ']
+    assert canvas._map[:4] == [(0, 0), (0, 1), (0, 2), (1, 0)]
+
+    renders = []
+
+    def render(self):
+        renders.append(True)
+        return Canvas.render(self)
+
+    canvas.render = MethodType(render, canvas)
+
+    down = Event('Keyboard', 'keydown', key=chr(curses.KEY_DOWN))
+    canvas.move(0, 12)
+    await canvas.dispatch(down)
+
+    assert canvas.cursor() == (1, 12)
+    assert canvas._position(*canvas.cursor()) == (0, 40)
+
+    await canvas.dispatch(down)
+
+    assert canvas.cursor() == (2, 8)
+
+    await canvas.dispatch(down)
+
+    assert canvas.cursor() == (3, 5)
+
+    for _ in range(8):
+        await canvas.dispatch(down)
+
+    assert renders == []
+    assert canvas.cursor() == (9, 5)
+    assert (canvas.base_y, canvas.base_segment) == (0, 2)
+    assert canvas.window.instr(0, 0, 8).decode() == 'Maecenas'
+    assert canvas.window.instr(9, 0, 6).decode() == 'line 4'
+
+    canvas.move(1, 5)
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='X', data='X'))
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='X', data='X'))
+
+    assert renders == []
+    assert canvas.buffer[1] == 'shortXX'
+    assert canvas.cursor() == (1, 7)
+
+    canvas.move(2, 0)
+    await canvas.dispatch(Event('Keyboard', 'paste', data='y' * 40))
+
+    assert renders == []
+    assert canvas.cursor() == (3, 11)
+    assert canvas.window.instr(3, 0, 13).decode() == 'y' * 11 + 'ac'
+    assert canvas.window.instr(4, 0, 8).decode() == 'Praesent'
+
+    canvas.move(3, 11)
+    await canvas.dispatch(Event(
+        'Keyboard', 'keydown', key=chr(curses.KEY_BACKSPACE)))
+
+    assert canvas.buffer[2].startswith('y' * 39 + 'ac felis')
+    assert canvas.cursor() == (3, 10)
+
+    for _ in range(4):
+        await canvas.dispatch(Event(
+            'Keyboard', 'keydown', key=chr(curses.KEY_UP)))
+
+    assert renders == []
+    assert canvas.cursor() == (0, 7)
+    assert (canvas.base_y, canvas.base_segment) == (0, 1)
+
+    entry.pin(0, 0, 10, 40)
+    root.render()
+
+    assert canvas.wrapper.width == 39
+    assert (canvas.base_y, canvas.base_segment) == (0, 1)
+    assert canvas.content.splitlines()[:2] == [
+        'consectetur adipiscing elit. Maecenas', 'shortXX']
+
+    entry.pin(0, 0, 10, 20)
+    root.render()
+
+    assert (canvas.base_y, canvas.base_segment) == (0, 2)
+    assert canvas.content.splitlines()[:3] == [
+        'consectetur ', 'adipiscing elit. ', 'Maecenas']
+
+
+async def test_entry_wrap_defers_jumps(root):
+    content = '\n'.join(f'line {index} ' + 'x' * 30 for index in range(100))
+    entry = Entry(root, content=content, wrap=True,
+                  position='fixed').style(border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+    canvas.find('line 80 ')
+    await canvas._scan
+
+    renders = []
+
+    def render(self):
+        renders.append(True)
+        return Canvas.render(self)
+
+    canvas.render = MethodType(render, canvas)
+    canvas.update()
+    renders.clear()
+
+    canvas.move(0, 0)
+    canvas.find_next()
+
+    assert renders == []
+    assert canvas._dirty is True
+    assert canvas.cursor() == (9, 0)
+    assert canvas._position(9, 0) == (80, 0)
+
+    canvas.update()
+
+    assert renders == [True]
+    assert canvas.cursor() == (9, 0)
+    assert canvas.window.instr(9, 0, 8).decode() == 'line 80 '
+
+
+async def test_entry_wrap_typing_benchmark(root):
+    content = '\n'.join(f'line {index}' for index in range(500_000))
+    entry = Entry(root, content=content, wrap=True,
+                  position='fixed').style(border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+    canvas._reveal(499_990, 0)
+    canvas.update()
+
+    start = time.time()
+    for _ in range(50):
+        await canvas.dispatch(Event('Keyboard', 'keydown', key='x',
+                                    data='x'))
+    await canvas.dispatch(Event('Keyboard', 'keydown', key='\n'))
+    elapsed = time.time() - start
+
+    assert canvas.buffer[499_990] == 'x' * 50
+    assert canvas.buffer[499_991] == 'line 499990'
+    assert canvas._position(*canvas.cursor()) == (499_991, 0)
+    assert elapsed < 0.5
+
+
+async def test_entry_wrap_long_line_benchmark(root):
+    content = ' '.join(f'word{index:06d}' for index in range(100_000))
+    entry = Entry(root, content=content, wrap=True,
+                  position='fixed').style(border=[]).pin(0, 0, 10, 30)
+    root.render()
+    canvas = entry.canvas
+
+    renders = []
+    canvas.render = MethodType(
+        lambda self: renders.append(True) or self, canvas)
+
+    canvas.move(0, 0)
+    event = Event('Keyboard', 'keydown', key=chr(curses.KEY_DOWN))
+    start = time.time()
+    for _ in range(5_000):
+        await canvas.dispatch(event)
+    elapsed = time.time() - start
+
+    assert renders == []
+    assert canvas.cursor() == (9, 0)
+    assert canvas._position(9, 0) == (0, 5_000 * 22)
+    assert elapsed < 2
@@ -1,8 +1,11 @@
+import curses
 import asyncio
 from types import MethodType
 from pytest import mark, raises
 from widark.widget.components.listbox import Listitem
-from widark.widget import Listbox, Widget, Event
+from widark.widget.components.source import Source
+from widark.widget.components.table import Table
+from widark.widget import Listbox, Widget, Event, Style
 from widark.widget.event import Target
 
 pytestmark = mark.asyncio
@@ -216,28 +219,22 @@ async def test_listbox_page_down(root):
         ['014', 'Luke', 'luke@mail.com']
     ]
 
-    connect_called = False
-
-    def mock_connect(self):
-        nonlocal connect_called
-        connect_called = True
-        return self
-
     listbox = Listbox(root, data=data, limit=4)
-    listbox.connect = MethodType(mock_connect, listbox)
 
     assert listbox.offset is None
 
     await listbox.dispatch(Event('Keyboard', 'keydown', key='A'))
     await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
     assert listbox.offset == 4
-    assert connect_called is True
+    assert listbox._dirty is True
+    assert [row.item for row in listbox.children] == data[4:8]
 
     await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
     assert listbox.offset == 8
 
     await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
     assert listbox.offset == 12
+    assert [row.item for row in listbox.children] == data[12:]
 
     await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
     assert listbox.offset == 12
@@ -261,22 +258,15 @@ async def test_listbox_page_up(root):
         ['014', 'Luke', 'luke@mail.com']
     ]
 
-    connect_called = False
-
-    def mock_connect(self):
-        nonlocal connect_called
-        connect_called = True
-        return self
-
     listbox = Listbox(root, data=data, limit=4, offset=8)
-    listbox.connect = MethodType(mock_connect, listbox)
 
     assert listbox.offset == 8
 
     await listbox.dispatch(Event('Keyboard', 'keydown', key='A'))
     await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(339)))
     assert listbox.offset == 4
-    assert connect_called is True
+    assert listbox._dirty is True
+    assert [row.item for row in listbox.children] == data[4:8]
 
     await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(339)))
     assert listbox.offset == 0
@@ -306,3 +296,283 @@ async def test_listbox_focus_on_click(root):
     await asyncio.sleep(0)
 
     await listbox.dispatch(event)
+
+
+def test_listbox_virtual(root):
+    data = [f'item {index}' for index in range(100_000)]
+
+    listbox = Listbox(root, data=data, virtual=True)
+
+    assert listbox.children == []
+
+    listbox.render()
+
+    assert len(listbox.children) == 18
+    assert listbox.limit == 18
+    assert listbox.offset == 0
+    assert [row.content for row in listbox.children[:2]] == [
+        'item 0', 'item 1']
+    assert listbox.children[17].window.getbegyx() == (17, 0)
+
+
+async def test_listbox_virtual_page_recycles_rows(root):
+    data = [{'id': f'{index:03d}', 'name': f'name {index}'}
+            for index in range(40)]
+
+    listbox = Listbox(root, data=data, fields=['id', 'name'],
+                      virtual=True, item_size=2).render()
+    rows = list(listbox.children)
+
+    assert len(rows) == 9
+
+    await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
+
+    assert listbox.offset == 9
+    assert listbox.children == rows
+    assert rows[0].item is data[9]
+    assert rows[0].children[1].content == 'name 9'
+    assert listbox._dirty is True
+
+    for _ in range(5):
+        await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
+
+    assert listbox.offset == 31
+    assert rows[-1].item is data[39]
+
+    await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(339)))
+
+    assert listbox.offset == 22
+    assert listbox.children == rows
+
+
+async def test_listbox_virtual_smooth_scroll(root):
+    data = [f'item {index}' for index in range(100)]
+
+    listbox = Listbox(root, data=data, virtual=True).render()
+    rows = list(listbox.children)
+
+    await listbox.dispatch(
+        Event('Keyboard', 'keydown', key=chr(curses.KEY_DOWN)))
+
+    assert listbox.offset == 1
+    assert listbox.children == rows
+    assert listbox._dirty is False
+    assert [row._dirty for row in rows].count(True) == 1
+    assert rows[-1]._dirty is True
+    assert rows[0].item == 'item 1'
+    assert rows[0].window.instr(0, 0).decode().strip() == 'item 1'
+
+    listbox.update()
+
+    assert rows[-1].window.instr(0, 0).decode().strip() == 'item 18'
+
+    await listbox.dispatch(Event('Mouse', 'press', button=4))
+
+    assert listbox.offset == 0
+    assert rows[0]._dirty is True
+    assert rows[1].window.instr(0, 0).decode().strip() == 'item 1'
+
+    await listbox.dispatch(Event('Mouse', 'press', button=5))
+    await listbox.dispatch(
+        Event('Keyboard', 'keydown', key=chr(curses.KEY_UP)))
+    await listbox.dispatch(
+        Event('Keyboard', 'keydown', key=chr(curses.KEY_UP)))
+
+    assert listbox.offset == 0
+
+
+async def test_listbox_virtual_scroll_keeps_border(root):
+    data = [f'item {index}' for index in range(100)]
+
+    listbox = Listbox(root, data=data, virtual=True,
+                      style=Style(border=[0])).render()
+    height, _ = listbox.window.getmaxyx()
+
+    def screen():
+        return [listbox.window.instr(row, 0).decode()
+                for row in range(height)]
+
+    await listbox.dispatch(
+        Event('Keyboard', 'keydown', key=chr(curses.KEY_DOWN)))
+    listbox.update()
+
+    assert listbox.offset == 1
+    scrolled = screen()
+
+    listbox.render()
+
+    assert scrolled == screen()
+
+
+async def test_listbox_virtual_table(root):
+    table = Table(['id', 'name'], ((f'{index}', f'name {index}')
+                                   for index in range(1000)))
+
+    listbox = Listbox(root, data=table, fields=['id', 'name'],
+                      virtual=True).render()
+    rows = list(listbox.children)
+
+    assert rows[0].children[1].content == 'name 0'
+
+    listbox.scroll(1)
+
+    assert rows[0].item == table[1]
+    assert [row._pending for row in rows].count(True) == 1
+
+    listbox.scroll(990)
+
+    assert listbox.offset == 982
+    assert rows[-1].children[0].content == '999'
+
+
+def test_listbox_flat_rows(root):
+    data = [{'id': f'{index}', 'name': f'name {index}', 'city': 'Lima'}
+            for index in range(10)]
+
+    listbox = Listbox(
+        root, data=data, fields=['id', 'name', 'city'], flat=True,
+        widths=[6], field_style=Style(align='L'),
+        field_styles={'city': Style(align='R', template='[{}]')}
+    ).render()
+
+    assert len(listbox.children) == 10
+    assert list(listbox.descendants()) == listbox.children
+
+    row = listbox.children[3]
+    line = row.window.instr(0, 0).decode()
+
+    assert line == '3'.ljust(6) + 'name 3'.ljust(42) + '[Lima]'.rjust(42)
+    assert [cell[2:4] for cell in row._cells()] == [
+        (0, 6), (6, 42), (48, 42)]
+
+    row.bind({'id': '99', 'name': 'other'}).render()
+
+    assert row.content == ''
+    assert row.window.instr(0, 0).decode() == (
+        '99'.ljust(6) + 'other'.ljust(42) + '[]'.rjust(42))
+
+
+def test_listbox_flat_keeps_field_template(root):
+    class Cell(Widget):
+        pass
+
+    listbox = Listbox(
+        root, data=[{'id': '1', 'name': 'one'}], fields=['id', 'name'],
+        flat=True, field_template=Cell).render()
+
+    row = listbox.children[0]
+
+    assert row.flat is False
+    assert [type(child) for child in row.children] == [Cell, Cell]
+
+
+async def test_listbox_query(root):
+    data = [{'name': name} for name in (
+        'maria', 'mario', 'ana', 'marcos', 'luis')]
+
+    listbox = Listbox(root, data=data, fields=['name']).render()
+
+    listbox.search('name', 'mar')
+
+    assert [row.item['name'] for row in listbox.children] == [
+        'maria', 'mario', 'marcos']
+
+    listbox.filter(lambda item: item['name'].endswith('o'))
+
+    assert [row.item['name'] for row in listbox.children] == ['mario']
+
+    listbox.filter(None).search('name', '').sort('name', reverse=True)
+
+    assert [row.item['name'] for row in listbox.children] == [
+        'mario', 'maria', 'marcos', 'luis', 'ana']
+
+
+def test_listbox_virtual_query(root):
+    data = [f'{index:04d}' for index in range(1000)]
+    listbox = Listbox(root, data=[{'id': item} for item in data],
+                      fields=['id'], virtual=True).render()
+    rows = list(listbox.children)
+    listbox.scroll(50)
+
+    listbox.search('id', '09')
+
+    assert listbox.offset == 0
+    assert listbox.children == rows
+    assert rows[0].item == {'id': '0900'}
+    assert listbox._total() == 100
+
+    listbox.scroll(1000)
+
+    assert listbox.offset == 82
+
+
+def test_listbox_virtual_short_data_and_resize(root):
+    listbox = Listbox(root, data=['first', 'second'], virtual=True).render()
+
+    assert len(listbox.children) == 18
+    assert [row.content for row in listbox.children[:3]] == [
+        'first', 'second', '']
+
+    root.window.resize(10, 90)
+    listbox.pin(0, 0, 10, 90).render()
+
+    assert len(listbox.children) == 10
+
+
+def test_listbox_virtual_custom_template(root):
+    class CustomTemplate(Widget):
+        def setup(self, **context) -> 'CustomTemplate':
+            item = context.pop('item', '')
+            return super().setup(
+                **context, content=f'-- {item} --') and self
+
+    data = [f'item {index}' for index in range(50)]
+    listbox = Listbox(root, data=data, template=CustomTemplate,
+                      virtual=True).render()
+
+    listbox.scroll(3)
+
+    assert listbox.offset == 3
+    assert len(listbox.children) == 18
+    assert listbox.children[0].content == '-- item 3 --'
+
+
+async def test_listbox_source(root):
+    class MemorySource(Source):
+        def __init__(self) -> None:
+            self.fetches = []
+
+        async def count(self) -> int:
+            return 5_000_000
+
+        async def fetch(self, offset: int, limit: int):
+            self.fetches.append(offset)
+            await asyncio.sleep(0)
+            return [{'name': f'name {index}'}
+                    for index in range(offset, offset + limit)]
+
+    source = MemorySource()
+    listbox = Listbox(root, source=source, fields=['name'],
+                      page_size=20, page_cache=4).render()
+
+    assert listbox.virtual is True
+    assert len(listbox.children) == 18
+    assert listbox.children[0].item is None
+
+    await listbox.load()
+
+    assert listbox.children[0].item == {'name': '...'}
+
+    await asyncio.sleep(1 / 50)
+
+    assert listbox.children[0].item == {'name': 'name 0'}
+    assert listbox.children[17].children[0].content == 'name 17'
+    assert sorted(source.fetches) == [0, 20]
+
+    await listbox.dispatch(Event('Keyboard', 'keydown', key=chr(338)))
+    await asyncio.sleep(1 / 50)
+
+    assert listbox.offset == 18
+    assert listbox.children[0].item == {'name': 'name 18'}
+    assert sorted(source.fetches) == [0, 20, 40]
+    assert len(listbox._pager.pages) <= 4
@@ -0,0 +1,228 @@
+import time
+import curses
+import asyncio
+from types import MethodType
+from pytest import mark
+from widark.widget import Logview, Event, Style
+
+pytestmark = mark.asyncio
+
+
+def test_logview_instantiation_defaults(root):
+    logview = Logview(root)
+    assert logview.source is None
+    assert logview.capacity == 10000
+    assert logview.follow is True
+    assert len(logview.lines) == 0
+    assert logview.offset == 0
+
+
+def test_logview_capacity(root):
+    logview = Logview(root, capacity=5).render()
+
+    logview.extend(f'line {index}' for index in range(8))
+    logview.update()
+
+    assert list(logview.lines) == [f'line {index}' for index in range(3, 8)]
+
+
+def test_logview_batches_appends_until_update(root):
+    logview = Logview(root).render()
+    root._pending = logview._pending = False
+
+    logview.append('first').append(b'second\r\n')
+
+    assert len(logview.lines) == 0
+    assert logview._pending is True
+    assert root._pending is True
+    assert logview._dirty is False
+
+    root.update()
+
+    assert list(logview.lines) == ['first', 'second']
+    assert logview.window.instr(1, 0).decode().strip() == 'second'
+
+
+def test_logview_follow_scrolls_new_lines(root):
+    logview = Logview(root).render()
+    logview.extend(f'line {index}' for index in range(40))
+    logview.update()
+
+    height, _ = logview.size()
+    assert logview.window.instr(
+        height - 1, 0).decode().strip() == 'line 39'
+
+    renders = []
+    logview.render = MethodType(
+        lambda self: renders.append(True) or self, logview)
+
+    logview.extend(['line 40', 'line 41'])
+    logview.update()
+
+    assert renders == []
+    assert logview.offset == 42 - height
+    assert logview.window.instr(
+        height - 1, 0).decode().strip() == 'line 41'
+    assert logview.window.instr(
+        height - 3, 0).decode().strip() == 'line 39'
+    assert logview.window.instr(
+        0, 0).decode().strip() == f'line {42 - height}'
+
+
+def test_logview_follow_with_border(root):
+    logview = Logview(root, style=Style(border=[0])).render()
+    logview.extend(f'line {index}' for index in range(40))
+    logview.update()
+    logview.extend(['line 40'])
+    logview.update()
+
+    height, _ = logview.size()
+    assert logview.window.instr(
+        height - 2, 1).decode().strip().startswith('line 40')
+    assert logview.window.instr(
+        1, 1).decode().strip().startswith(f'line {41 - height + 2}')
+
+
+def test_logview_follow_keeps_border(root):
+    logview = Logview(root, style=Style(border=[0])).render()
+    logview.extend(f'line {index}' for index in range(40))
+    logview.update()
+    height, _ = logview.window.getmaxyx()
+
+    def screen():
+        return [logview.window.instr(row, 0).decode()
+                for row in range(height)]
+
+    renders = []
+    logview.render = MethodType(
+        lambda self: renders.append(True) or self, logview)
+
+    logview.extend(['new a', 'new b'])
+    logview.update()
+
+    assert renders == []
+    scrolled = screen()
+
+    del logview.render
+    logview.render()
+
+    assert scrolled == screen()
+
+
+async def test_logview_pause_and_resume(root):
+    logview = Logview(root).render()
+    logview.extend(f'line {index}' for index in range(40))
+    logview.update()
+    height, _ = logview.size()
+
+    await logview.dispatch(Event('Keyboard', 'keydown', key=chr(
+        curses.KEY_UP)))
+    logview.update()
+
+    assert logview.follow is False
+    assert logview.offset == 40 - height - 1
+    assert logview.window.instr(
+        height - 1, 0).decode().strip() == 'line 38'
+
+    renders = []
+    logview.render = MethodType(
+        lambda self: renders.append(True) or self, logview)
+
+    logview.extend(['line 40', 'line 41'])
+    logview.update()
+
+    assert renders == []
+    assert logview.window.instr(
+        height - 1, 0).decode().strip() == 'line 38'
+
+    del logview.render
+    await logview.dispatch(Event('Keyboard', 'keydown', key=chr(
+        curses.KEY_PPAGE)))
+    logview.update()
+
+    assert logview.offset == 40 - 2 * height - 1
+
+    await logview.dispatch(Event('Mouse', 'press', button=5))
+    logview.update()
+
+    assert logview.offset == 40 - 2 * height
+
+    await logview.dispatch(Event('Keyboard', 'keydown', key=chr(
+        curses.KEY_END)))
+    logview.update()
+
+    assert logview.follow is True
+    assert logview.offset == 42 - height
+    assert logview.window.instr(
+        height - 1, 0).decode().strip() == 'line 41'
+
+
+def test_logview_paused_view_survives_eviction(root):
+    logview = Logview(root, capacity=30).render()
+    logview.extend(f'line {index}' for index in range(30))
+    logview.update()
+    height, _ = logview.size()
+
+    logview.scroll(-5)
+    logview.update()
+    top = logview.window.instr(0, 0).decode().strip()
+
+    logview.extend(['line 30', 'line 31'])
+    logview.update()
+
+    assert logview.offset == 30 - height - 7
+    assert logview.window.instr(0, 0).decode().strip() == top
+
+
+async def test_logview_load_stream_reader(root):
+    reader = asyncio.StreamReader()
+    reader.feed_data(b'alpha\nbeta\r\nga')
+    reader.feed_data(b'mma\ndelta')
+    reader.feed_eof()
+
+    logview = Logview(root, source=reader).render()
+    await logview.load()
+    logview.update()
+
+    assert list(logview.lines) == ['alpha', 'beta', 'gamma', 'delta']
+
+
+async def test_logview_load_async_iterator(root):
+    async def produce():
+        for index in range(3000):
+            yield f'line {index}\n'
+
+    logview = Logview(root, source=produce(), capacity=100).render()
+    await logview.load()
+    logview.update()
+
+    assert len(logview.lines) == 100
+    assert logview.lines[-1] == 'line 2999'
+
+
+async def test_logview_throughput(root):
+    reader = asyncio.StreamReader()
+    payload = b''.join(
+        b'%d GET /service/endpoint status=200 elapsed=0.0042\n' % index
+        for index in range(50000))
+    logview = Logview(root, source=reader).render()
+
+    ticks = []
+
+    async def tick():
+        while not reader.at_eof():
+            logview.update()
+            ticks.append(True)
+            await asyncio.sleep(0)
+
+    start = time.time()
+    for offset in range(0, len(payload), 1 << 16):
+        reader.feed_data(payload[offset: offset + (1 << 16)])
+    reader.feed_eof()
+    await asyncio.gather(logview.load(), tick())
+    logview.update()
+    elapsed = time.time() - start
+
+    assert len(ticks) > 1
+    assert logview.lines[-1].startswith('49999 GET')
+    assert elapsed < 1
@@ -0,0 +1,117 @@
+import time
+from widark.widget.components.query import Query
+from widark.widget.components.table import Table
+
+
+DATA = [
+    {'name': 'maria', 'city': 'Quito'},
+    {'name': 'mario', 'city': 'Lima'},
+    {'name': 'ana', 'city': 'Lima'},
+    {'name': 'marcos', 'city': 'Bogota'},
+    {'name': 'luis', 'city': 'Quito'},
+]
+
+
+def names(query):
+    return [item['name'] for item in query[:]]
+
+
+def test_query_passthrough():
+    query = Query(DATA)
+
+    assert query.active is False
+    assert len(query) == 5
+    assert query[1] is DATA[1]
+    assert query[1:3] == DATA[1:3]
+
+
+def test_query_filter_and_sort():
+    query = Query(DATA)
+
+    query.filter(lambda item: item['city'] != 'Bogota')
+
+    assert query.active is True
+    assert names(query) == ['maria', 'mario', 'ana', 'luis']
+
+    query.sort('city', 'name')
+
+    assert names(query) == ['ana', 'mario', 'luis', 'maria']
+
+    query.sort('name', reverse=True).filter(None)
+
+    assert names(query) == ['mario', 'maria', 'marcos', 'luis', 'ana']
+
+    query.sort()
+
+    assert query.active is False
+
+
+def test_query_prefix_search():
+    query = Query(DATA)
+
+    query.search('name', 'mar')
+
+    assert names(query) == ['maria', 'mario', 'marcos']
+    assert query._range[2:] == (2, 5)
+
+    query.search('name', 'mari')
+
+    assert names(query) == ['maria', 'mario']
+    assert query._range[2:] == (3, 5)
+
+    query.search('name', 'x')
+
+    assert names(query) == []
+
+    query.sort('name', reverse=True).search('name', 'mar')
+
+    assert names(query) == ['mario', 'maria', 'marcos']
+
+    query.search('name', '')
+
+    assert len(query) == 5
+
+
+def test_query_prefix_search_narrows_previous_result():
+    query = Query(DATA).sort('city')
+
+    query.search('name', 'mar')
+
+    assert names(query) == ['marcos', 'mario', 'maria']
+
+    query.filter(lambda item: item['city'] == 'Quito')
+    query.search('name', 'ma')
+
+    assert names(query) == ['maria']
+
+    scanned = []
+    query._columns['name'] = Spy(query._columns['name'], scanned)
+    query.search('name', 'mari')
+
+    assert names(query) == ['maria']
+    assert scanned == [0]
+
+
+class Spy(list):
+    def __init__(self, values, scanned) -> None:
+        super().__init__(values)
+        self.scanned = scanned
+
+    def __getitem__(self, index):
+        self.scanned.append(index)
+        return super().__getitem__(index)
+
+
+def test_query_table_search_benchmark():
+    table = Table(['name'], ([f'name {index:06d}'] for index in
+                             range(200_000)))
+    query = Query(table).sort('name')
+
+    start = time.perf_counter()
+    for prefix in ('n', 'na', 'name', 'name 1', 'name 12', 'name 123'):
+        query.search('name', prefix)
+    elapsed = (time.perf_counter() - start) / 6
+
+    assert len(query) == 1000
+    assert query[0]['name'] == 'name 123000'
+    assert elapsed < 0.01
@@ -0,0 +1,171 @@
+import time
+import random
+import asyncio
+from pytest import mark
+from widark.widget import Search, Rope, DefaultBuffer
+
+
+def test_search_literal():
+    search = Search(['alpha beta', 'gamma', 'beta beta'], 'beta')
+
+    assert search.line(0) == [(6, 10)]
+    assert search.line(1) == []
+    assert search.line(2) == [(0, 4), (5, 9)]
+    assert search.total == 3
+
+
+def test_search_regex_and_ignorecase():
+    search = Search(['Error: 42', 'error: 7', 'ok'])
+
+    search.find(r'\d+', regex=True)
+    assert search.line(0) == [(7, 9)]
+    assert search.line(1) == [(7, 8)]
+
+    search.find('error', ignorecase=True)
+    assert search.line(0) == [(0, 5)]
+    assert search.line(1) == [(0, 5)]
+
+    search.find('x*', regex=True)
+    assert search.line(2) == []
+
+
+def test_search_narrowing_keeps_misses():
+    lines = ['abc', 'xyz', 'abd']
+    search = Search(lines, 'ab')
+    for index in range(3):
+        search.line(index)
+
+    search.find('abc')
+
+    assert search._cache == [None, [], None]
+    assert search.total == 0
+    assert search.line(0) == [(0, 3)]
+    assert search.line(2) == []
+
+
+def test_search_invalidate_only_edited_lines():
+    buffer = Rope('one\ntwo one\nthree')
+    search = Search(buffer, 'one')
+    for index in range(3):
+        search.line(index)
+    assert search.total == 2
+
+    buffer.write(1, 0, 'one\n')
+    search.invalidate(1, 1)
+
+    assert search._cache == [[(0, 3)], None, None, []]
+    assert search.total == 1
+    assert search.line(1) == [(0, 3)]
+    assert search.line(2) == [(4, 7)]
+    assert search.total == 3
+
+    buffer.delete(0, 3, 1)
+    search.invalidate(0, -1)
+
+    assert search._cache == [None, [(4, 7)], []]
+    assert search.line(0) == [(0, 3), (3, 6)]
+    assert search.total == 3
+
+
+def test_search_next():
+    search = Search(['a x', 'b', 'x x'], 'x')
+
+    assert search.next(0, 0) == (0, 2, 3)
+    assert search.next(0, 2) == (2, 0, 1)
+    assert search.next(2, 0) == (2, 2, 3)
+    assert search.next(2, 2) == (0, 2, 3)
+    assert search.next(2, 2, reverse=True) == (2, 0, 1)
+    assert search.next(0, 2, reverse=True) == (2, 2, 3)
+
+    search.find('missing')
+    assert search.next(0, 0) is None
+
+
+def test_search_next_matches_linear_walk():
+    def walk(lines, y, x, reverse):
+        step = -1 if reverse else 1
+        for count in range(len(lines) + 1):
+            index = (y + step * count) % len(lines)
+            matches = [(start, start + 1) for start, character in
+                       enumerate(lines[index]) if character == 'x']
+            for start, end in (matches[::-1] if reverse else matches):
+                if count == 0 and (start >= x if reverse else start <= x):
+                    continue
+                if count == len(lines) and (
+                        start < x if reverse else start > x):
+                    continue
+                return index, start, end
+        return None
+
+    generator = random.Random(3)
+    for _ in range(30):
+        buffer = DefaultBuffer(
+            ''.join(generator.choice('ab') for _ in range(6))
+            for _ in range(generator.randint(1, 30)))
+        search = Search(buffer, 'x')
+        search.scanned = generator.randint(0, len(buffer))
+        search._fill(0, search.scanned)
+
+        for _ in range(20):
+            y = generator.randrange(len(buffer))
+            x = generator.randint(0, len(buffer[y]))
+            if generator.random() < 0.5:
+                text = generator.choice(['x', 'ax', '\n', 'x\nx', 'b'])
+                buffer.write(y, x, text)
+                search.invalidate(y, text.count('\n'))
+            elif len(buffer) > 1 and y < len(buffer) - 1:
+                buffer.delete(y, len(buffer[y]), 1)
+                search.invalidate(y, -1)
+            y = generator.randrange(len(buffer))
+            reverse = generator.random() < 0.5
+
+            assert search.next(y, x, reverse) == walk(
+                buffer, y, x, reverse)
+
+
+@mark.asyncio
+async def test_search_scan_yields_to_loop():
+    lines = [f'{index} lorem ipsum dolor' for index in range(500_000)]
+    search = Search(lines, 'ipsum 9', budget=0.002)
+
+    gaps = []
+
+    async def tick():
+        last = time.perf_counter()
+        while not search.complete:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    await asyncio.gather(search.scan(), tick())
+
+    assert search.total == 0
+    assert search.complete
+    assert len(gaps) > 10
+    assert max(gaps) < 0.1
+
+    start = time.perf_counter()
+    search.find('ipsum 99')
+
+    assert await search.scan() == 0
+    assert time.perf_counter() - start < 0.2
+
+
+@mark.asyncio
+async def test_search_next_benchmark():
+    lines = DefaultBuffer(
+        f'{index} lorem ipsum dolor' for index in range(500_000))
+    lines[10] += ' needle'
+    search = Search(lines, 'needle')
+    await search.scan()
+
+    start = time.perf_counter()
+    for _ in range(100):
+        assert search.next(10, 40) == (10, 21, 27)
+    lines.write(20, 0, 'needle ')
+    search.invalidate(20)
+
+    assert search.next(10, 40) == (20, 0, 6)
+    assert search.next(20, 0, reverse=True) == (10, 21, 27)
+    assert time.perf_counter() - start < 0.1
@@ -0,0 +1,97 @@
+import asyncio
+from pytest import mark, raises
+from widark.widget.components.source import Source, Pager
+
+
+pytestmark = mark.asyncio
+
+
+class MemorySource(Source):
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.fetches = []
+
+    async def count(self) -> int:
+        return self.total
+
+    async def fetch(self, offset: int, limit: int):
+        self.fetches.append((offset, limit))
+        await asyncio.sleep(0)
+        return [f'row {index}' for index in
+                range(offset, min(offset + limit, self.total))]
+
+
+async def test_source_not_implemented():
+    source = Source()
+
+    with raises(NotImplementedError):
+        await source.count()
+
+    with raises(NotImplementedError):
+        await source.fetch(0, 10)
+
+
+async def test_pager_get():
+    loaded = []
+    source = MemorySource(95)
+    pager = Pager(source, size=10, capacity=3, callback=loaded.append)
+
+    assert await pager.count() == 95
+
+    assert pager.get(12, 'placeholder') == 'placeholder'
+    assert pager.get(15, 'placeholder') == 'placeholder'
+    assert list(pager.requests) == [1]
+
+    await asyncio.sleep(1 / 50)
+
+    assert pager.get(12) == 'row 12'
+    assert loaded == [1]
+    assert source.fetches == [(10, 10)]
+
+
+async def test_pager_prefetch_and_eviction():
+    source = MemorySource(95)
+    pager = Pager(source, size=10, capacity=3)
+    await pager.count()
+
+    pager.prefetch(20, 30)
+    await asyncio.sleep(1 / 50)
+
+    assert sorted(pager.pages) == [1, 2, 3]
+
+    pager.get(95)
+    pager.prefetch(90, 95)
+    await asyncio.sleep(1 / 50)
+
+    assert sorted(pager.pages) == [3, 8, 9]
+    assert (100, 10) not in source.fetches
+    assert pager.get(90) == 'row 90'
+
+
+async def test_pager_small_capacity_keeps_window():
+    loaded = []
+    source = MemorySource(95)
+    pager = Pager(source, size=10, capacity=1)
+    await pager.count()
+
+    view = [30, 45]
+
+    def reload(number):
+        loaded.append(number)
+        pager.prefetch(*view)
+
+    pager.callback = reload
+    pager.prefetch(*view)
+    await asyncio.sleep(1 / 20)
+
+    assert sorted(pager.pages) == [2, 3, 4, 5]
+    assert sorted(loaded) == [2, 3, 4, 5]
+    assert len(source.fetches) == 4
+
+    view[:] = [80, 85]
+    pager.prefetch(*view)
+    await asyncio.sleep(1 / 20)
+
+    assert sorted(pager.pages) == [7, 8, 9]
+    assert len(source.fetches) == 7
+    assert pager.get(80) == 'row 80'
@@ -0,0 +1,105 @@
+import asyncio
+from pytest import mark, raises
+from widark.widget import Tokenizer, RegexTokenizer, Syntax, Rope
+
+
+KEY, NUMBER, COMMENT = 1, 2, 3
+
+
+def make_tokenizer():
+    return RegexTokenizer(
+        rules=[(r'^\w+(?==)', KEY), (r'\d+', NUMBER)],
+        blocks=[(r'/\*', r'\*/', COMMENT)])
+
+
+def test_tokenizer_abstract():
+    with raises(NotImplementedError):
+        Tokenizer().tokenize('line', None)
+
+
+def test_regex_tokenizer_rules():
+    tokenizer = make_tokenizer()
+
+    assert tokenizer.tokenize('port=8080', None) == (
+        [(0, 4, KEY), (5, 9, NUMBER)], None)
+    assert tokenizer.tokenize('', None) == ([], None)
+    assert RegexTokenizer().tokenize('text', None) == ([], None)
+
+
+def test_regex_tokenizer_blocks():
+    tokenizer = make_tokenizer()
+
+    assert tokenizer.tokenize('a=1 /* note', None) == (
+        [(0, 1, KEY), (2, 3, NUMBER), (4, 11, COMMENT)], 0)
+    assert tokenizer.tokenize('still 42', 0) == ([(0, 8, COMMENT)], 0)
+    assert tokenizer.tokenize('end */ 7', 0) == (
+        [(0, 6, COMMENT), (7, 8, NUMBER)], None)
+    assert tokenizer.tokenize('/* a */ 5 /* b */', None) == (
+        [(0, 7, COMMENT), (8, 9, NUMBER), (10, 17, COMMENT)], None)
+
+
+def test_syntax_ensure_is_lazy():
+    lines = [f'key{index}={index}' for index in range(1000)]
+    syntax = Syntax(make_tokenizer(), lines)
+
+    syntax.ensure(50)
+
+    assert syntax.frontier == 50
+    assert syntax.tokens[49] == [(0, 5, KEY), (6, 8, NUMBER)]
+    assert syntax.tokens[50] is None
+    assert syntax.line(60) == [(0, 5, KEY), (6, 8, NUMBER)]
+    assert syntax.frontier == 61
+
+
+def test_syntax_converges_after_edit():
+    buffer = Rope('\n'.join(f'key{index}={index}' for index in range(100)))
+    tokenizer = make_tokenizer()
+    syntax = Syntax(tokenizer, buffer)
+    syntax.ensure(100)
+
+    tokenized = []
+    tokenize = tokenizer.tokenize
+    tokenizer.tokenize = lambda line, state: tokenized.append(
+        line) or tokenize(line, state)
+
+    buffer.write(10, 0, '# ')
+    syntax.invalidate(10)
+    syntax.ensure(100)
+
+    assert tokenized == ['# key10=10']
+    assert syntax.tokens[10] == [(5, 7, NUMBER), (8, 10, NUMBER)]
+
+    tokenized.clear()
+    buffer.write(20, 0, '/* ')
+    syntax.invalidate(20)
+    syntax.ensure(30)
+
+    assert len(tokenized) == 10
+    assert syntax.tokens[29] == [(0, 8, COMMENT)]
+
+    tokenized.clear()
+    buffer.write(25, 0, '*/\n')
+    syntax.invalidate(25, 1)
+    syntax.ensure(101)
+
+    assert tokenized[:2] == ['*/', 'key25=25']
+    assert len(tokenized) == 7
+    assert syntax.tokens[26] == [(0, 5, KEY), (6, 8, NUMBER)]
+    assert syntax.tokens[100] == [(0, 5, KEY), (6, 8, NUMBER)]
+
+
+@mark.asyncio
+async def test_syntax_scan_yields():
+    lines = [f'key{index}={index}' for index in range(20_000)]
+    syntax = Syntax(make_tokenizer(), lines, budget=0)
+
+    assert syntax.known(10) == []
+
+    scan = asyncio.ensure_future(syntax.scan(10_000))
+    await asyncio.sleep(0)
+
+    assert 0 < syntax.frontier < 10_000
+    assert syntax.known(10) == [(0, 5, KEY), (6, 8, NUMBER)]
+
+    assert await scan == 10_000
+    assert syntax.tokens[10_000] is None
@@ -0,0 +1,96 @@
+from pytest import raises
+from widark.widget.components.table import Table, Row, Column, View
+
+
+class Person:
+    def __init__(self, name: str, city: str) -> None:
+        self.name = name
+        self.city = city
+
+
+def test_table_append_and_index():
+    table = Table(['name', 'city'], [
+        {'name': 'Ana', 'city': 'Lima'},
+        ['Luis', 'Quito'],
+        Person('Eva', 'Lima'),
+        ['Ñandú']
+    ])
+
+    assert len(table) == 4
+    assert dict(table[0]) == {'name': 'Ana', 'city': 'Lima'}
+    assert table[1]['city'] == 'Quito'
+    assert table[2].get('name') == 'Eva'
+    assert dict(table[-1]) == {'name': 'Ñandú', 'city': ''}
+    assert list(table.column('name')) == ['Ana', 'Luis', 'Eva', 'Ñandú']
+
+    with raises(IndexError):
+        table[4]
+
+
+def test_table_slice_is_a_view():
+    table = Table(['id'], ([f'{index}'] for index in range(100)))
+
+    view = table[10:20]
+
+    assert isinstance(view, Table)
+    assert view.columns is table.columns
+    assert len(view) == 10
+    assert view[0]['id'] == '10'
+    assert view[2:4][1]['id'] == '13'
+    assert len(table[95:120]) == 5
+    assert len(table[50:10]) == 0
+    assert [row['id'] for row in table[0:6:2]] == ['0', '2', '4']
+    assert view[0] == table[10]
+    assert view[0] != table[11]
+    assert table[0] == {'id': '0'}
+
+    with raises(ValueError):
+        view.append(['100'])
+
+    column = view.column('id')
+
+    assert isinstance(column, View)
+    assert len(column) == 10
+    assert column[0] == '10'
+    assert column[-1] == '19'
+    assert column[1:3] == ['11', '12']
+
+    with raises(IndexError):
+        column[10]
+
+
+def test_column_negative_index():
+    column = Column()
+    for value in ('a', 'bb', 'ccc'):
+        column.append(value)
+
+    assert column[-1] == 'ccc'
+    assert column[-3] == 'a'
+
+    with raises(IndexError):
+        column[3]
+
+    with raises(IndexError):
+        column[-4]
+
+
+def test_table_categories_are_interned():
+    table = Table(['name', 'status'], categories=['status'])
+    for index in range(1000):
+        table.append([f'name {index}', 'active' if index % 2 else 'idle'])
+
+    status = table.columns['status']
+
+    assert status.pool == ['idle', 'active']
+    assert table[1]['status'] is table[3]['status']
+    assert table.column('status')[:3] == ['idle', 'active', 'idle']
+
+
+def test_table_compact_storage():
+    table = Table(['id', 'name', 'status'], categories=['status'])
+    for index in range(100_000):
+        table.append((f'{index:06d}', f'name {index}', 'active'))
+
+    assert table.nbytes < 100_000 * 48
+    assert isinstance(table[99_999], Row)
+    assert table[99_999]['name'] == 'name 99999'
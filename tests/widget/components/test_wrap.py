@@ -0,0 +1,58 @@
+from widark.widget import Wrap, Rope
+
+
+def test_wrap_segments():
+    wrap = Wrap(['short', 'lorem ipsum dolor sit amet', 'x' * 25, ''], 10)
+
+    assert wrap.segments(0) == [0]
+    assert wrap.segments(1) == [0, 6, 12, 22]
+    assert wrap.text(1, 1) == 'ipsum '
+    assert wrap.text(1, 3) == 'amet'
+    assert wrap.segments(2) == [0, 10, 20]
+    assert wrap.segments(3) == [0]
+
+
+def test_wrap_locate_and_limit():
+    wrap = Wrap(['lorem ipsum dolor sit amet'], 10)
+
+    assert wrap.locate(0, 0) == 0
+    assert wrap.locate(0, 5) == 0
+    assert wrap.locate(0, 6) == 1
+    assert wrap.locate(0, 26) == 3
+    assert wrap.limit(0, 0) == 5
+    assert wrap.limit(0, 3) == 26
+
+
+def test_wrap_navigation():
+    wrap = Wrap(['a' * 25, 'b', 'c' * 12], 10)
+
+    assert wrap.next(0, 1) == (0, 2)
+    assert wrap.next(0, 2) == (1, 0)
+    assert wrap.next(2, 1) is None
+    assert wrap.previous(1, 0) == (0, 2)
+    assert wrap.previous(0, 0) is None
+    assert wrap.rows(0, 1, 4) == [(0, 1), (0, 2), (1, 0), (2, 0)]
+    assert wrap.rows(2, 0, 5) == [(2, 0), (2, 1)]
+
+
+def test_wrap_invalidate_and_resize():
+    buffer = Rope('\n'.join('word ' * 10 for _ in range(5)))
+    wrap = Wrap(buffer, 20)
+    for line in range(5):
+        wrap.segments(line)
+
+    buffer.write(2, 0, 'new\n')
+    wrap.invalidate(2, 1)
+
+    assert wrap._starts[2] is None and wrap._starts[3] is None
+    assert wrap._starts[4] == [0, 20, 40]
+    assert wrap.segments(2) == [0]
+
+    wrap.resize(20)
+
+    assert wrap._starts[4] == [0, 20, 40]
+
+    wrap.resize(30)
+
+    assert wrap._starts == [None] * 6
+    assert wrap.segments(4) == [0, 30]
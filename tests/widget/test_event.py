@@ -332,3 +332,36 @@ async def test_target_dispatch_event_stop_capturing(targets):
     assert len(fourth._capture_listeners['click']) == 1
     assert len(fourth._bubble_listeners['click']) == 1
     assert calls == ['capture', 'capture:stopped']
+
+
+def test_target_path(targets):
+    first, _, third, fourth = targets
+
+    path = fourth.path
+
+    assert path == [fourth, third, first]
+    assert fourth.path is path
+    assert first.path == [first]
+
+
+async def test_target_dispatch_skips_ancestor_dispatch(targets):
+    first, _, third, fourth = targets
+
+    calls = []
+
+    async def bubble_click_handler(event: Event) -> None:
+        calls.append((event.current, event.phase))
+
+    async def fail_dispatch(event: Event) -> None:
+        raise AssertionError('Ancestors must not be re-dispatched.')
+
+    first.listen('click', bubble_click_handler)
+    first.dispatch = fail_dispatch
+    third.dispatch = fail_dispatch
+
+    event = Event('Mouse', 'click', y=9, x=7)
+    await fourth.dispatch(event)
+
+    assert event.path == [fourth, third, first]
+    assert event.target is fourth
+    assert calls == [(first, 'Bubble')]
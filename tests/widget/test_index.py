@@ -0,0 +1,46 @@
+from widark.widget import Target
+from widark.widget.index import Index
+
+
+def make_target(y_min, x_min, y_max, x_max, order):
+    target = Target()
+    target._y_min, target._x_min = y_min, x_min
+    target._y_max, target._x_max = y_max, x_max
+    target._order = order
+    return target
+
+
+def test_index_instantiation_defaults():
+    index = Index()
+    assert index.cell == 8
+    assert index.buckets == {}
+
+
+def test_index_build():
+    first = make_target(0, 0, 10, 20, 1)
+    second = make_target(2, 2, 4, 4, 2)
+    empty = make_target(5, 5, 5, 5, 3)
+
+    index = Index(cell=8)
+    result = index.build([first, second, empty])
+
+    assert result is index
+    assert set(index.buckets) == {(0, 0), (0, 1), (0, 2), (1, 0),
+                                  (1, 1), (1, 2)}
+    assert index.buckets[(0, 0)] == [second, first]
+    assert all(empty not in bucket for bucket in index.buckets.values())
+
+
+def test_index_query_topmost():
+    background = make_target(0, 0, 18, 90, 1)
+    panel = make_target(0, 0, 18, 45, 2)
+    button = make_target(3, 3, 6, 20, 3)
+    overlay = make_target(2, 10, 12, 60, 4)
+
+    index = Index().build([background, panel, button, overlay])
+
+    assert index.query(4, 5) is button
+    assert index.query(4, 15) is overlay
+    assert index.query(15, 5) is panel
+    assert index.query(15, 70) is background
+    assert index.query(30, 100) is None
@@ -1,5 +1,7 @@
 import curses
+import time
 import asyncio
+from types import MethodType
 from pytest import mark
 from widark.widget import Widget, Target, Style
 
@@ -698,3 +700,232 @@ def test_widget_arrange_margin(root):
 
     _, child_d_dimensions = arrangement[3]
     assert child_d_dimensions == {'y': 1, 'x': 76, 'height': 10, 'width': 10}
+
+
+def test_widget_invalidate(root):
+    parent = Widget(root)
+    child = Widget(parent)
+    root.render()
+
+    assert child._dirty is False
+    assert parent._pending is False
+    assert root._pending is False
+
+    result = child.invalidate()
+
+    assert result is child
+    assert child._dirty is True
+    assert parent._dirty is False
+    assert parent._pending is True
+    assert root._pending is True
+
+
+def test_widget_invalidate_geometry(root):
+    parent = Widget(root)
+    child = Widget(parent)
+    root.render()
+
+    child.style(align='C')
+    assert child._dirty is True
+    assert parent._dirty is False
+
+    root.render()
+
+    child.grid(1, 0)
+    assert parent._dirty is True
+
+    root.render()
+
+    parent.remove(child)
+    assert parent._dirty is True
+
+
+def test_widget_update(root):
+    parent = Widget(root)
+    child_a = Widget(parent).grid(0, 0)
+    child_b = Widget(parent).grid(0, 1)
+    root.render()
+
+    rendered = []
+    for widget in [root, parent, child_a, child_b]:
+        def render(self, original=widget.render):
+            rendered.append(self)
+            return original()
+        widget.render = MethodType(render, widget)
+
+    result = root.update()
+
+    assert result is root
+    assert rendered == []
+
+    child_b.content = 'Updated'
+    child_b.invalidate()
+    root.update()
+
+    assert rendered == [child_b]
+    assert child_b.window.instr(0, 0, 7) == b'Updated'
+    assert root._pending is False
+    assert child_b._dirty is False
+
+
+def test_widget_update_overlapping_fixed(root):
+    child_a = Widget(root).grid(0, 0)
+    child_b = Widget(root).grid(0, 1)
+    overlay = Widget(root, position='fixed').pin(2, 2, 4, 10)
+    root.render()
+
+    rendered = []
+    for widget in [child_a, child_b, overlay]:
+        def render(self, original=widget.render):
+            rendered.append(self)
+            return original()
+        widget.render = MethodType(render, widget)
+
+    child_b.invalidate()
+    root.update()
+
+    assert rendered == [child_b]
+
+    rendered.clear()
+    child_a.invalidate()
+    root.update()
+
+    assert rendered == [child_a, overlay]
+
+
+def test_widget_request_render(root):
+    parent = Widget(root)
+    child = Widget(parent)
+    root.render()
+
+    rendered = []
+    for widget in [parent, child]:
+        def render(self, original=widget.render):
+            rendered.append(self)
+            return original()
+        widget.render = MethodType(render, widget)
+
+    result = child.request_render()
+    child.request_render()
+    parent.request_render()
+
+    assert result is child
+    assert rendered == []
+
+    root.update()
+
+    assert rendered == [parent, child]
+
+
+def test_widget_render_erases_without_full_repaint(root):
+    class SpyWindow:
+        def __init__(self, window) -> None:
+            self.window = window
+            self.calls = []
+
+        def __getattr__(self, name):
+            self.calls.append(name)
+            return getattr(self.window, name)
+
+    spy = SpyWindow(root.window)
+    root.window = spy
+
+    root.render()
+    root.clear()
+
+    assert 'erase' in spy.calls
+    assert 'clear' not in spy.calls
+
+
+def test_widget_render_reuses_window(root):
+    widget = Widget(root).pin(1, 2, 5, 10).render()
+    window = widget.window
+
+    widget.render()
+    assert widget.window is window
+
+    widget.pin(1, 2, 6, 12).render()
+    assert widget.window is window
+    assert widget.window.getmaxyx() == (6, 12)
+
+    widget.pin(3, 4, 6, 12).render()
+    assert widget.window is not window
+    assert widget.window.getbegyx() == (3, 4)
+
+    window = widget.window
+    root.remove(widget)
+    root.add(widget)
+    widget.pin(3, 4, 6, 12).render()
+    assert widget.window is not window
+
+
+def test_widget_layout_linear_benchmark(root):
+    parent = Widget(root, mode='compact')
+    parent.window = root.window
+
+    children = [Widget(parent).grid(index, index % 3)
+                for index in range(10_000)]
+
+    start = time.perf_counter()
+    layout = parent.layout(parent.children)
+    elapsed = time.perf_counter() - start
+
+    assert len(layout) == 10_000
+    assert layout[0] == (children[0], {
+        'y': 0, 'x': 0, 'height': 0, 'width': 30})
+    assert layout[-1][1]['x'] == 0
+    assert elapsed < 1
+
+
+def test_widget_layout_cache(root):
+    parent = Widget(root)
+    child_a = Widget(parent).grid(0, 0)
+    child_b = Widget(parent).grid(0, 1)
+
+    calls = []
+
+    def layout(self, children, original=parent.layout):
+        calls.append(len(children))
+        return original(children)
+
+    parent.layout = MethodType(layout, parent)
+
+    root.render()
+    root.render()
+    parent.content = 'Content'
+    parent.invalidate()
+    root.update()
+
+    assert calls == [2]
+
+    child_a.grid(1, 0)
+    root.update()
+
+    assert calls == [2, 2]
+    assert child_b.window.getbegyx() == (9, 45)
+
+    Widget(parent).grid(2, 0)
+    root.update()
+
+    assert calls == [2, 2, 3]
+
+    root.window.resize(12, 60)
+    root.render()
+
+    assert calls == [2, 2, 3, 3]
+
+
+def test_widget_path_invalidation(root):
+    parent = Widget(root)
+    other = Widget(root)
+    child = Widget(parent)
+
+    assert child.path == [child, parent, root]
+
+    other.add(child)
+
+    assert child.path == [child, other, root]
+
+    other.remove(child)
+
+    assert child.path == [child]
@@ -1,18 +1,42 @@
 import sys
 import curses
 import asyncio
+from collections import deque
 from signal import signal, SIGINT
-from typing import Tuple, List, Any
+from typing import Tuple, List, Dict, Deque, Any, Optional, Union, cast
 from .widget import Widget, Event, MOUSE_EVENTS, Target
+from .widget.index import Index
 from .palette import DefaultPalette, Palette
 
 
+Mouse = Tuple[int, int, int, int, int]
+
+Input = Tuple[int, Optional[Union[Mouse, str]]]
+
+PASTE = -2
+
+BRACKETS = ([27, 91, 50, 48, 48, 126], [27, 91, 50, 48, 49, 126])
+
+
 class Application(Widget):
     def __init__(self, palette: Palette = None, **context) -> None:
         super().__init__(None, **context, autoload=True, autobuild=False)
         self.active = True
         self.palette = palette or DefaultPalette()
+        self.reactive: bool = context.get('reactive', False)
+        self.coalesce: bool = context.get('coalesce', True)
+        self.paste: bool = context.get('paste', True)
+        self.metrics: Dict[str, int] = {'peak': 0, 'dropped': 0}
+        self._queue: Deque[Input] = deque(
+            maxlen=context.get('capacity', 1024))
         self._rate = 1 / 20
+        self._idle = 1
+        self._stream: Any = sys.stdin
+        self._signal: Optional[asyncio.Event] = None
+        self._escape: List[int] = []
+        self._pasted: Optional[bytearray] = None
+        self._index = Index()
+        self._indexed = -1
         signal(SIGINT, self._interrupt)
 
     async def prepare(self) -> None:
@@ -28,67 +52,148 @@ class Application(Widget):
 
     async def _run(self) -> None:
         self._start_screen()
+        self._listen()
         self.connect()
 
         while self.active:
-            await asyncio.sleep(self._rate)
-
-            key, buffer = self._read()
+            await self._wait()
 
-            await self._process(key, buffer)
+            queue = self._read()
+            while queue:
+                await self._process(*queue.popleft())
 
+            self.update()
             curses.doupdate()
-            curses.flushinp()
 
         self._stop_screen()
 
-    def _read(self) -> Tuple[int, List[int]]:
+    def _listen(self) -> None:
+        if not self.reactive:
+            return
+        self._signal = asyncio.Event()
+        asyncio.get_event_loop().add_reader(
+            self._stream.fileno(), self._signal.set)
+        if self._dirty or self._pending:
+            self._signal.set()
+
+    def _unlisten(self) -> None:
+        if not self._signal:
+            return
+        asyncio.get_event_loop().remove_reader(self._stream.fileno())
+        self._signal = None
+
+    async def _wait(self) -> None:
+        if not self._signal:
+            await asyncio.sleep(self._rate)
+            return
+
+        try:
+            await asyncio.wait_for(self._signal.wait(), self._idle)
+        except asyncio.TimeoutError:
+            pass
+        self._signal.clear()
+
+    def _awake(self) -> None:
+        if self._signal:
+            self._signal.set()
+
+    def _read(self) -> Deque[Input]:
         key = self.window.getch()
-        buffer = []
-        if key != -1:
-            character = key
-            while character != -1:
-                buffer.append(character)
-                character = self.window.getch()
-
-        return key, buffer
-
-    async def _process(self, key: int, buffer: List[int]) -> None:
-        data = "".join(chr(character) for character in buffer)
-        if key == curses.KEY_RESIZE:
+        while key != -1:
+            mouse: Optional[Mouse] = None
+            if self._bracket(key):
+                key = self.window.getch()
+                continue
+            if key == curses.KEY_MOUSE:
+                try:
+                    mouse = curses.getmouse()
+                except curses.error:
+                    key = self.window.getch()
+                    continue
+            self._enqueue(key, mouse)
+            key = self.window.getch()
+
+        self._flush()
+        return self._queue
+
+    def _bracket(self, key: int) -> bool:
+        start, end = BRACKETS
+        if self._pasted is not None:
+            if 0 <= key < 256:
+                self._pasted.append(key)
+            if self._pasted.endswith(bytes(end)):
+                text = self._pasted[:-len(end)].decode('utf-8', 'replace')
+                self._pasted = None
+                self._enqueue(PASTE, text)
+            return True
+
+        if not self._escape and key != start[0]:
+            return False
+
+        candidate = self._escape + [key]
+        if candidate != start[:len(candidate)]:
+            self._flush()
+            return self._bracket(key)
+
+        self._escape = candidate
+        if candidate == start:
+            self._escape, self._pasted = [], bytearray()
+        return True
+
+    def _flush(self) -> None:
+        escape, self._escape = self._escape, []
+        for key in escape:
+            self._enqueue(key, None)
+
+    def _enqueue(self, key: int, detail: Any) -> None:
+        queue = self._queue
+        if (self.coalesce and key == curses.KEY_MOUSE and queue and
+                queue[-1][0] == curses.KEY_MOUSE and
+                _motion(detail) and _motion(queue[-1][1])):
+            queue[-1] = (key, detail)
+            return
+
+        if len(queue) == queue.maxlen:
+            self.metrics['dropped'] += 1
+        queue.append((key, detail))
+        self.metrics['peak'] = max(self.metrics['peak'], len(queue))
+
+    async def _process(self, key: int, detail: Any = None) -> None:
+        if key == PASTE:
+            y, x = curses.getsyx()
+            event = Event('Keyboard', 'paste', y=y, x=x, data=detail)
+            target = self._capture(event)
+            if not _accepts(target.path, 'paste'):
+                for character in detail:
+                    await self._process(ord(character))
+                return
+            await target.dispatch(event)
+        elif key == curses.KEY_RESIZE:
             self._clear_screen()
             self.render()
         elif key == curses.KEY_MOUSE:
-            _, x, y, _, state = curses.getmouse()
+            _, x, y, _, state = detail or curses.getmouse()
             button, event_type = MOUSE_EVENTS.get(state, (0, ''))
             event = Event('Mouse', event_type, y=y, x=x,
-                          key=chr(key), button=button, data=data)
+                          key=chr(key), button=button, data=chr(key))
             target = self._capture(event)
             await target.dispatch(event)
         elif key >= 0:
             y, x = curses.getsyx()
             event = Event('Keyboard', 'keydown', y=y, x=x,
-                          key=chr(key), data=data)
+                          key=chr(key), data=chr(key))
             target = self._capture(event)
             await target.dispatch(event)
 
     def _capture(self, event: Event) -> Widget:
-        target: Widget = self
-        path: List[Target] = [self]
-
-        children = target.children
-        while children:  # pragma: no cover
-            for child in children:
-                if child.hit(event):
-                    children = child.children
-                    target = child
-                    path.append(target)
-                    break
-            else:
-                children = []
-
-        event.path = list(reversed(path))
-        return target
+        if self._indexed != Widget._sequence:
+            self._index.build(
+                widget for widget in self.descendants() if widget.window)
+            self._indexed = Widget._sequence
+
+        target: Target = self._index.query(event.y, event.x) or self
+        event.path = list(target.path)
+        return cast(Widget, target)
 
     def _start_screen(self) -> None:
         self.window = curses.initscr()
@@ -98,6 +203,8 @@ class Application(Widget):
         curses.noecho()
         curses.mousemask(
             curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
+        if self.paste:
+            curses.putp(b'\x1b[?2004h')
         curses.start_color()
         curses.use_default_colors()
         for pair, foreground, background in self.palette.generate():
@@ -107,6 +214,7 @@ class Application(Widget):
         self.window.clear()
 
     def _stop_screen(self) -> None:
+        self._unlisten()
         self._clear_screen()
         self.window.timeout(-1)
         self.window.keypad(False)
@@ -114,8 +222,19 @@ class Application(Widget):
         self.window = None
         curses.echo()
         curses.mousemask(False)
+        if self.paste:
+            curses.putp(b'\x1b[?2004l')
         curses.endwin()
 
     def _interrupt(self, signal: int, frame: Any) -> None:
         self._stop_screen()
         sys.exit(0)
+
+
+def _accepts(path: List[Target], type: str) -> bool:
+    return any(element._capture_listeners.get(type) or
+               element._bubble_listeners.get(type) for element in path)
+
+
+def _motion(mouse: Any) -> bool:
+    return bool(mouse) and mouse[-1] == curses.REPORT_MOUSE_POSITION
@@ -5,3 +5,10 @@ from .frame import Frame
 from .entry import Entry
 from .modal import Modal
 from .listbox import Listbox, Listitem
+from .source import Source, Pager
+from .table import Table, Column, Category, Row
+from .buffer import Buffer, DefaultBuffer, Rope, FileBuffer
+from .logview import Logview
+from .search import Search
+from .syntax import Tokenizer, RegexTokenizer, Syntax
+from .wrap import Wrap
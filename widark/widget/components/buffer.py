@@ -0,0 +1,492 @@
+import os
+import mmap
+import asyncio
+from array import array
+from itertools import accumulate, islice
+from random import random
+from typing import Any, Iterator, List, Optional, Tuple
+
+
+class Buffer:
+    async def load(self) -> None:
+        """Custom asynchronous load"""
+
+    def write(self, y: int, x: int, text: str) -> None:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def delete(self, y: int, x: int, count: int) -> None:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def read(self) -> str:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def offset(self, y: int, x: int) -> int:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def length(self, y: int) -> int:
+        return len(self[y])
+
+    def excerpt(self, y: int, start: int, stop: int) -> str:
+        return self[y][start:stop]
+
+    def __len__(self) -> int:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def __getitem__(self, index: Any) -> Any:
+        raise NotImplementedError('Please provide your own buffer.')
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (Buffer, list)):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+
+
+class DefaultBuffer(list, Buffer):
+    def write(self, y: int, x: int, text: str) -> None:
+        line = self[y]
+        head, tail = line[:x], line[x:]
+        pieces = text.split('\n')
+        pieces[0] = head + pieces[0]
+        pieces[-1] += tail
+        self[y:y + 1] = pieces
+
+    def delete(self, y: int, x: int, count: int) -> None:
+        head, tail = self[y][:x], self[y][x:]
+        stop = y + 1
+        while len(tail) < count and stop < len(self):
+            count -= len(tail) + 1
+            tail = self[stop]
+            stop += 1
+        self[y:stop] = [head + tail[count:]]
+
+    def read(self) -> str:
+        return '\n'.join(self)
+
+    def offset(self, y: int, x: int) -> int:
+        return sum(len(line) + 1 for line in self[:y]) + min(
+            x, len(self[y]) if y < len(self) else 0)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        for y, line in enumerate(self):
+            if offset <= len(line):
+                return y, offset
+            offset -= len(line) + 1
+        return len(self) - 1, len(self[-1])
+
+
+class Rope(Buffer):
+    def __init__(self, text: str = '', chunk: int = 1024) -> None:
+        self.chunk = max(chunk, 1)
+        self.root = self._build(text)
+
+    def write(self, y: int, x: int, text: str) -> None:
+        if not text:
+            return
+
+        offset = self.offset(y, x)
+        node, path, cut = self._locate(offset)
+        if node and len(node.text) + len(text) <= 2 * self.chunk:
+            node.text = node.text[:cut] + text + node.text[cut:]
+            self._amend(node, path, len(text), text.count('\n'))
+            return
+
+        left, right = _split(self.root, offset)
+        self.root = _merge(_merge(left, self._build(text)), right)
+
+    def delete(self, y: int, x: int, count: int) -> None:
+        start = self.offset(y, x)
+        stop = min(start + max(count, 0), _size(self.root))
+        if stop <= start:
+            return
+
+        node, path, cut = self._locate(start)
+        if node and cut + stop - start < len(node.text):
+            removed = node.text[cut:cut + stop - start]
+            node.text = node.text[:cut] + node.text[cut + stop - start:]
+            self._amend(node, path, -len(removed), -removed.count('\n'))
+            return
+
+        left, rest = _split(self.root, start)
+        _, right = _split(rest, stop - start)
+        self.root = _merge(left, right)
+
+    def read(self) -> str:
+        return self._extract(0, _size(self.root))
+
+    def offset(self, y: int, x: int) -> int:
+        start = self._start(y)
+        end = self._end(y)
+        return start + min(max(x, 0), end - start)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        offset = min(max(offset, 0), _size(self.root))
+        y, node, base = 0, self.root, 0
+        while node:
+            left = _size(node.left)
+            if offset < base + left:
+                node = node.left
+                continue
+            y += _lines(node.left)
+            cut = offset - base - left
+            if cut <= len(node.text):
+                y += node.text.count('\n', 0, cut)
+                break
+            y += node.breaks
+            base += left + len(node.text)
+            node = node.right
+        return y, offset - self._start(y)
+
+    def length(self, y: int) -> int:
+        if not 0 <= y < len(self):
+            raise IndexError('Buffer index out of range.')
+        return self._end(y) - self._start(y)
+
+    def excerpt(self, y: int, start: int, stop: int) -> str:
+        if not 0 <= y < len(self):
+            raise IndexError('Buffer index out of range.')
+        begin, end = self._start(y), self._end(y)
+        start, stop, _ = slice(start, stop).indices(end - begin)
+        return self._extract(begin + start, begin + max(stop, start))
+
+    def __len__(self) -> int:
+        return _lines(self.root) + 1
+
+    def __getitem__(self, index: Any) -> Any:
+        total = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(total)
+            if step != 1:
+                return [self[line] for line in range(start, stop, step)]
+            if stop <= start:
+                return []
+            return self._extract(
+                self._start(start), self._end(stop - 1)).split('\n')
+
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError('Buffer index out of range.')
+        return self._extract(self._start(index), self._end(index))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.read().split('\n'))
+
+    def _start(self, y: int) -> int:
+        if y <= 0:
+            return 0
+        if y > _lines(self.root):
+            return _size(self.root)
+
+        node, base = self.root, 0
+        while node:
+            left = _lines(node.left)
+            if y <= left:
+                node = node.left
+            elif y <= left + node.breaks:
+                index = -1
+                for _ in range(y - left):
+                    index = node.text.index('\n', index + 1)
+                return base + _size(node.left) + index + 1
+            else:
+                y -= left + node.breaks
+                base += _size(node.left) + len(node.text)
+                node = node.right
+        return base
+
+    def _end(self, y: int) -> int:
+        if y + 1 > _lines(self.root):
+            return _size(self.root)
+        return self._start(y + 1) - 1
+
+    def _extract(self, start: int, stop: int) -> str:
+        parts: List[str] = []
+        _collect(self.root, 0, start, stop, parts)
+        return ''.join(parts)
+
+    def _locate(self, offset: int) -> Tuple[
+            Optional['Node'], List['Node'], int]:
+        path: List[Node] = []
+        node, base = self.root, 0
+        while node:
+            left = _size(node.left)
+            if offset < base + left:
+                path.append(node)
+                node = node.left
+            elif offset <= base + left + len(node.text):
+                return node, path, offset - base - left
+            else:
+                path.append(node)
+                base += left + len(node.text)
+                node = node.right
+        return None, path, 0
+
+    def _amend(self, node: 'Node', path: List['Node'],
+               size: int, breaks: int) -> None:
+        node.breaks += breaks
+        for ancestor in path + [node]:
+            ancestor.size += size
+            ancestor.lines += breaks
+
+    def _build(self, text: str) -> Optional['Node']:
+        nodes = [Node(text[start:start + self.chunk])
+                 for start in range(0, len(text), self.chunk)]
+        root = _balance(nodes, 0, len(nodes))
+
+        priorities = sorted((random() for _ in nodes), reverse=True)
+        level = [root] if root else []
+        index = 0
+        while level:
+            following: List[Node] = []
+            for node in level:
+                node.priority = priorities[index]
+                index += 1
+                following.extend(
+                    child for child in (node.left, node.right) if child)
+            level = following
+
+        return root
+
+
+class FileBuffer(Buffer):
+    def __init__(self, path: str, encoding: str = 'utf-8',
+                 chunk: int = 1 << 20) -> None:
+        self.path = path
+        self.encoding = encoding
+        self.chunk = max(chunk, 1)
+        self.starts = array('Q', [0])
+        self.scanned = 0
+        self.file = open(path, 'rb')
+        self.map: Any = b''
+        if os.fstat(self.file.fileno()).st_size:
+            self.map = mmap.mmap(
+                self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.pieces: List[Piece] = [(None, 0, -1)]
+        self._scan()
+
+    @property
+    def complete(self) -> bool:
+        return self.scanned >= len(self.map)
+
+    async def load(self) -> None:
+        while not self.complete:
+            self._scan()
+            await asyncio.sleep(0)
+
+    def close(self) -> None:
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+        self.file.close()
+
+    def write(self, y: int, x: int, text: str) -> None:
+        self._edit(y, y + 1).write(0, x, text)
+
+    def delete(self, y: int, x: int, count: int) -> None:
+        stop, remaining = y + 1, count - (len(self[y]) - x)
+        while remaining > 0 and stop < len(self):
+            remaining -= len(self[stop]) + 1
+            stop += 1
+        self._edit(y, stop).delete(0, x, count)
+
+    def read(self) -> str:
+        return '\n'.join(self)
+
+    def offset(self, y: int, x: int) -> int:
+        total = sum(len(line) + 1 for line in islice(self, max(y, 0)))
+        return total + min(x, len(self[y]) if y < len(self) else 0)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        y, line = 0, ''
+        for y, line in enumerate(self):
+            if offset <= len(line):
+                return y, offset
+            offset -= len(line) + 1
+        return y, len(line)
+
+    def __len__(self) -> int:
+        return sum(self._count(piece) for piece in self.pieces)
+
+    def __getitem__(self, index: Any) -> Any:
+        total = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(total)
+            return [self._line(line) for line in range(start, stop, step)]
+
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError('Buffer index out of range.')
+        return self._line(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for piece in list(self.pieces):
+            source, first, _ = piece
+            if source is not None:
+                yield from source
+                continue
+            for line in range(first, first + self._count(piece)):
+                yield self._decode(line)
+
+    def _scan(self) -> None:
+        if self.complete:
+            return
+
+        start = self.scanned
+        stop = min(start + self.chunk, len(self.map))
+        lengths = [len(line) + 1 for line in
+                   self.map[start:stop].split(b'\n')[:-1]]
+        self.starts.extend(start + total for total in accumulate(lengths))
+        self.scanned = stop
+
+    def _count(self, piece: 'Piece') -> int:
+        source, first, count = piece
+        if source is not None:
+            return len(source)
+        if count >= 0:
+            return count
+        lines = len(self.starts) - (0 if self.complete else 1)
+        return max(lines - first, 0)
+
+    def _line(self, y: int) -> str:
+        for piece in self.pieces:
+            count = self._count(piece)
+            if y < count:
+                source, first, _ = piece
+                if source is not None:
+                    return source[y]
+                return self._decode(first + y)
+            y -= count
+        raise IndexError('Buffer index out of range.')
+
+    def _decode(self, line: int) -> str:
+        start = self.starts[line]
+        stop = (self.starts[line + 1] - 1 if line + 1 < len(self.starts)
+                else len(self.map))
+        return self.map[start:stop].decode(self.encoding, 'replace')
+
+    def _edit(self, start: int, stop: int) -> DefaultBuffer:
+        pieces: List[Piece] = []
+        lines = DefaultBuffer()
+        position = 0
+        for piece in self.pieces:
+            source, first, extent = piece
+            count = self._count(piece)
+            low = max(start - position, 0)
+            high = min(stop - position, count)
+            position += count
+            if low >= high:
+                pieces.append(piece)
+                continue
+
+            if source is not None:
+                head: Piece = (source[:low], 0, 0)
+                tail: Piece = (source[high:], 0, 0)
+                lines.extend(source[low:high])
+            else:
+                head = (None, first, low)
+                tail = (None, first + high,
+                        extent - high if extent >= 0 else -1)
+                lines.extend(self._decode(first + line)
+                             for line in range(low, high))
+
+            if low:
+                pieces.append(head)
+            if not any(item[0] is lines for item in pieces):
+                pieces.append((lines, 0, 0))
+            if high < count or extent < 0:
+                pieces.append(tail)
+
+        self.pieces = pieces
+        return lines
+
+
+Piece = Tuple[Optional[List[str]], int, int]
+
+
+class Node:
+    __slots__ = ('text', 'breaks', 'priority',
+                 'left', 'right', 'size', 'lines')
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.breaks = text.count('\n')
+        self.priority = random()
+        self.left: Optional[Node] = None
+        self.right: Optional[Node] = None
+        self.size = len(text)
+        self.lines = self.breaks
+
+
+def _size(node: Optional[Node]) -> int:
+    return node.size if node else 0
+
+
+def _lines(node: Optional[Node]) -> int:
+    return node.lines if node else 0
+
+
+def _update(node: Node) -> Node:
+    node.size = len(node.text) + _size(node.left) + _size(node.right)
+    node.lines = node.breaks + _lines(node.left) + _lines(node.right)
+    return node
+
+
+def _balance(nodes: List[Node], start: int, stop: int) -> Optional[Node]:
+    if start >= stop:
+        return None
+    middle = (start + stop) // 2
+    node = nodes[middle]
+    node.left = _balance(nodes, start, middle)
+    node.right = _balance(nodes, middle + 1, stop)
+    return _update(node)
+
+
+def _collect(node: Optional[Node], base: int, start: int, stop: int,
+             parts: List[str]) -> None:
+    if not node or stop <= base or start >= base + node.size:
+        return
+    middle = base + _size(node.left)
+    end = middle + len(node.text)
+    _collect(node.left, base, start, stop, parts)
+    if start < end and stop > middle:
+        parts.append(node.text[max(start - middle, 0):stop - middle])
+    _collect(node.right, end, start, stop, parts)
+
+
+def _split(node: Optional[Node], offset: int) -> Tuple[
+        Optional[Node], Optional[Node]]:
+    if not node:
+        return None, None
+
+    left = _size(node.left)
+    if offset <= left:
+        first, second = _split(node.left, offset)
+        node.left = second
+        return first, _update(node)
+
+    if offset >= left + len(node.text):
+        first, second = _split(node.right, offset - left - len(node.text))
+        node.right = first
+        return _update(node), second
+
+    cut = offset - left
+    head, tail = Node(node.text[:cut]), Node(node.text[cut:])
+    return _merge(node.left, head), _merge(tail, node.right)
+
+
+def _merge(first: Optional[Node], second: Optional[Node]) -> Optional[Node]:
+    if not first or not second:
+        return first or second
+
+    if first.priority > second.priority:
+        first.right = _merge(first.right, second)
+        return _update(first)
+
+    second.left = _merge(first, second.left)
+    return _update(second)
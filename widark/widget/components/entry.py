@@ -1,59 +1,361 @@
 import curses
-from typing import List, Tuple
-from ..widget import Widget
+import asyncio
+from typing import Any, List, Optional, Tuple, cast
+from ..widget import Widget, CursesError
 from ..event import Event
 from ..style import Style
+from .buffer import Buffer, DefaultBuffer
+from .search import Search
+from .syntax import Syntax, Token, Tokenizer
+from .wrap import Wrap, Segment
 
 
 class Entry(Widget):
     def setup(self, **context) -> 'Entry':
         self.canvas_content = context.pop('content', '')
+        self.canvas_buffer: Optional[Buffer] = context.pop('buffer', None)
+        self.canvas_tokenizer: Optional[Tokenizer] = context.pop(
+            'tokenizer', None)
+        self.canvas_wrap: bool = context.pop('wrap', False)
 
         style: Style = context.pop('style', Style(border=[0]))
         return super().setup(**context, style=style) and self
 
     def build(self) -> None:
-        self.canvas = Canvas(self, content=self.canvas_content)
+        self.canvas = Canvas(self, content=self.canvas_content,
+                             buffer=self.canvas_buffer,
+                             tokenizer=self.canvas_tokenizer,
+                             wrap=self.canvas_wrap)
 
     @property
     def text(self) -> str:
-        return '\n'.join(self.canvas.buffer)
+        return self.canvas.buffer.read()
 
 
 class Canvas(Widget):
     def setup(self, **context) -> 'Canvas':
         content = context.pop('content', '')
+        buffer = context.pop('buffer', None)
+        tokenizer: Optional[Tokenizer] = context.pop('tokenizer', None)
+        wrap: bool = context.pop('wrap', False)
+        self.highlight: int = context.pop('highlight', curses.A_REVERSE)
+        self.lookahead: int = context.pop('lookahead', 100)
 
-        self.buffer: List[str] = content.splitlines() or ['']
+        self.search: Optional[Search] = None
+        self.syntax: Optional[Syntax] = None
+        self.wrapper: Optional[Wrap] = None
+        self._scan: Optional[asyncio.Future] = None
+        self._jump: Optional[asyncio.Future] = None
+        self._tokenize: Optional[asyncio.Future] = None
+        self.buffer = content.splitlines() if buffer is None else buffer
         self.base_y: int = 0
         self.base_x: int = 0
+        self.base_segment: int = 0
+        self._view: List[str] = []
+        self._map: List[Segment] = []
+        self._painted: Optional[Tuple[int, int, int]] = None
+
+        if tokenizer:
+            self.syntax = Syntax(tokenizer, self.buffer)
+        if wrap:
+            self.wrapper = Wrap(self.buffer)
 
         self.listen('click', self.on_click)
         self.listen('keydown', self.on_keydown)
+        self.listen('paste', self.on_paste)
         return super().setup(**context) and self
 
+    async def load(self) -> None:
+        total = len(self.buffer)
+        await self.buffer.load()
+        if len(self.buffer) != total:
+            self.request_render()
+
+    @property
+    def buffer(self) -> Buffer:
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer: Any) -> None:
+        if not isinstance(buffer, Buffer):
+            buffer = DefaultBuffer(buffer or [''])
+        self._buffer = buffer
+        if self.search:
+            self.search.reset(buffer)
+        if self.syntax:
+            self.syntax.reset(buffer)
+        if self.wrapper:
+            self.wrapper.reset(buffer)
+
+    @property
+    def content(self) -> str:
+        return ''.join(f'{sentence}\n' for sentence in
+                       getattr(self, '_view', []))
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._view = content.splitlines()
+
     async def on_click(self, event: Event) -> None:
         origin_y, origin_x = self.window.getbegyx()
         y, x = event.y - origin_y,  event.x - origin_x
-        line = self.base_y + y + 1
-        self.move(min(y, len(self.buffer[:line]) - 1),
-                  min(x, len(self.buffer[:line][-1])))
+        if self.wrapper:
+            self._reveal(*self._position(y, x))
+            return
+        line = min(self.base_y + y + 1, len(self.buffer))
+        self.move(min(y, line - 1), min(x, self.buffer.length(line - 1)))
 
     def settle(self) -> None:
+        height, width = self._viewport()
+        if self.wrapper:
+            self._resize(width - 1)
+            self._map = self.wrapper.rows(
+                self.base_y, self.base_segment, height)
+            self._view = [self.wrapper.text(*row) for row in self._map]
+        else:
+            self._view = self._excerpts(
+                self.base_y, self.base_y + height, width)
+        self._painted = self._origin()
+
+    def render(self) -> 'Canvas':
+        window = self.window
+        cursor = window.getyx() if window else None
+        super().render()
+        if not self.window or self._dirty:
+            return self
+        if cursor and self.window is window:
+            self.window.move(*cursor)
+
+        height, _ = self._viewport()
+        try:
+            self._highlight(0, min(height, len(self._view)))
+        except CursesError:
+            return self
+
+        self.window.noutrefresh()
+        return self
+
+    def find(self, pattern: str, regex: bool = False,
+             ignorecase: bool = False) -> 'Canvas':
+        if self.search is None:
+            self.search = Search(self.buffer)
+        self.search.find(pattern, regex, ignorecase)
+        if self._scan:
+            self._scan.cancel()
+        self._scan = (asyncio.ensure_future(self.search.scan())
+                      if pattern else None)
+        return self.request_render()
+
+    def find_next(self, reverse: bool = False) -> 'Canvas':
+        if not self.search:
+            return self
+        if not self.search.complete:
+            if self._jump:
+                self._jump.cancel()
+            self._jump = asyncio.ensure_future(self._seek(reverse))
+            return self
+        y, x = self.cursor()
+        line, column = (self._position(y, x) if self.wrapper else
+                        (self.base_y + y, self.base_x + x))
+        result = self.search.next(line, column, reverse)
+        if not result:
+            return self
+
+        line, column, _ = result
+        if self.wrapper:
+            return self._reveal(line, column)
+
+        height, width = self._viewport()
+        if not self.base_y <= line < self.base_y + height:
+            self.base_y = max(line - height // 2, 0)
+        if not self.base_x <= column < self.base_x + width - 1:
+            self.base_x = max(column - width + 2, 0)
+        return self._sync().move(line - self.base_y, column - self.base_x)
+
+    async def _seek(self, reverse: bool) -> None:
+        if not self._scan or self._scan.done():
+            self._scan = asyncio.ensure_future(
+                cast(Search, self.search).scan())
+        await asyncio.shield(self._scan)
+        self.find_next(reverse)
+
+    def _highlight(self, start: int, stop: int) -> None:
+        search, syntax = self.search, self.syntax
+        if search and not search.pattern:
+            search = None
+        if not (search or syntax):
+            return
+
+        origin = 1 if self.styling.border else 0
+        height, width = self._viewport()
+        if syntax:
+            limit = self.base_y + height + self.lookahead
+            if syntax.frontier >= self.base_y - self.lookahead:
+                syntax.ensure(limit)
+            else:
+                self._catch_up(limit)
+
+        y, x = self.window.getyx()
+        for row in range(start, stop):
+            span = self._span(row, width)
+            if not span:
+                break
+            index, offset, limit = span
+            runs: List[Token] = []
+            if syntax:
+                runs.extend(syntax.known(index))
+            if search:
+                runs.extend((begin, end, self.highlight) for begin, end in
+                            search.line(index))
+            for begin, end, attribute in runs:
+                begin = max(begin - offset, 0)
+                end = min(end - offset, limit)
+                if begin < end:
+                    self.window.chgat(origin + row, origin + begin,
+                                      end - begin, attribute)
+        self.window.move(y, x)
+
+    def _catch_up(self, stop: int) -> None:
+        if self._tokenize:
+            self._tokenize.cancel()
+        self._tokenize = asyncio.ensure_future(self._restyle(stop))
+
+    async def _restyle(self, stop: int) -> None:
+        await cast(Syntax, self.syntax).scan(stop)
+        self.request_render()
+
+    def _span(self, row: int, width: int) -> Optional[Tuple[int, int, int]]:
+        if not self.wrapper:
+            if self.base_y + row >= len(self.buffer):
+                return None
+            return self.base_y + row, self.base_x, width - 1
+
+        if row >= len(self._map):
+            return None
+        line, segment = self._map[row]
+        offset = self.wrapper.segments(line)[segment]
+        return line, offset, self.wrapper.limit(line, segment) + 1 - offset
+
+    def _touch(self, line: int, delta: int = 0) -> None:
+        if self.search:
+            self.search.invalidate(line, delta)
+        if self.syntax:
+            self.syntax.invalidate(line, delta)
+        if self.wrapper:
+            self.wrapper.invalidate(line, delta)
+
+    def _origin(self) -> Tuple[int, int, int]:
+        return self.base_y, self.base_x, self.base_segment
+
+    def _viewport(self) -> Tuple[int, int]:
         origin = 1 if self.styling.border else 0
         height, width = self.size()
-        height -= 2 * origin
-        width -= 2 * origin
+        return height - 2 * origin, width - 2 * origin
+
+    def _defer(self) -> 'Canvas':
+        if self.window:
+            self.settle()
+        return self.request_render()
 
-        content = ''
-        for line in self.buffer[self.base_y: height + self.base_y]:
-            sentence = line[self.base_x: width - 1 + self.base_x]
-            content += f'{sentence}\n'
+    def _excerpts(self, start: int, stop: int, width: int) -> List[str]:
+        buffer, base_x = self.buffer, self.base_x
+        return [buffer.excerpt(line, base_x, base_x + width - 1)
+                for line in range(start, min(stop, len(buffer)))]
 
-        self.content = content
+    def _sync(self) -> 'Canvas':
+        painted = self._painted
+        if painted == self._origin():
+            return self
+
+        if self.wrapper:
+            return self._scroll()
+
+        if (not painted or self._dirty or not self.window or
+                self.styling.border or painted[1] != self.base_x or
+                abs(self.base_y - painted[0]) != 1):
+            return self._defer()
+
+        height, _ = self._viewport()
+        shift = self.base_y - painted[0]
+        try:
+            self.window.scrollok(True)
+            self.window.scroll(shift)
+            self.window.scrollok(False)
+        except CursesError:
+            return self._defer()
+
+        self._painted = self._origin()
+        if shift > 0:
+            self._view = self._view[1:]
+            return self._refresh(height - 1)
+
+        self._view = [''] + self._view[:height - 1]
+        return self._refresh(0)
+
+    def _refresh(self, line: int, delta: int = 0) -> 'Canvas':
+        if (self._dirty or not self.window or
+                self._painted != self._origin()):
+            return self._defer()
+
+        origin = 1 if self.styling.border else 0
+        height, width = self._viewport()
+        stop = min(line + 1 if not delta else height, height)
+        if line >= stop:
+            return self
+
+        sentences = self._excerpts(
+            self.base_y + line, self.base_y + stop, width)
+        if delta:
+            self._view[line:] = sentences
+        else:
+            self._view[line:line + 1] = sentences
+
+        try:
+            for row in range(line, stop):
+                sentence = (sentences[row - line]
+                            if row - line < len(sentences) else '')
+                self.window.addstr(origin + row, origin,
+                                   sentence.ljust(width - 1),
+                                   self.styling.color)
+            self._highlight(line, stop)
+        except CursesError:
+            return self._defer()
+
+        self.window.noutrefresh()
+        return self
+
+    async def on_paste(self, event: Event) -> None:
+        self.paste(event.data)
+
+    def paste(self, text: str) -> 'Canvas':
+        y, x = self.cursor()
+        insertion = text.replace('\r\n', '\n').replace('\r', '\n')
+        if self.wrapper:
+            return self._insert(*self._position(y, x), insertion)
+
+        delta = insertion.count('\n')
+        line = self.base_y + y
+        column = min(self.base_x + x, self.buffer.length(line))
+        self.buffer.write(line, column, insertion)
+        self._touch(line, delta)
+
+        line += delta
+        if delta:
+            column = len(insertion) - insertion.rfind('\n') - 1
+        else:
+            column += len(insertion)
+        height, width = self._viewport()
+        self.base_y = min(max(self.base_y, line - height + 1), line)
+        if not self.base_x <= column < self.base_x + width - 1:
+            self.base_x = max(column - width + 2, 0)
+
+        return self._refresh(y, delta).move(
+            line - self.base_y, column - self.base_x)
 
     async def on_keydown(self, event: Event) -> None:
-        if ord(event.key) == curses.KEY_LEFT:
+        if self.wrapper:
+            self._wrapped(event)
+        elif ord(event.key) == curses.KEY_LEFT:
             self._left()
         elif ord(event.key) == curses.KEY_RIGHT:
             self._right()
@@ -73,14 +375,13 @@ class Canvas(Widget):
     def _right(self) -> None:
         _, width = self.size()
         y, x = self.cursor()
-        sentence = self.buffer[self.base_y + y]
+        length = self.buffer.length(self.base_y + y)
         pillar = x + 1
-        if x >= width - 3 and len(sentence) - self.base_x - width >= 0:
+        if x >= width - 3 and length - self.base_x - width >= 0:
             pillar = x
-            max_shift = max(len(sentence) - width + 1, 0)
+            max_shift = max(length - width + 1, 0)
             self.base_x = min(self.base_x + 1, max_shift)
-            self.render()
-        self.move(y, min(pillar, max(len(sentence) - self.base_x, 0)))
+        self._sync().move(y, min(pillar, max(length - self.base_x, 0)))
 
     def _left(self) -> None:
         y, x = self.cursor()
@@ -88,8 +389,7 @@ class Canvas(Widget):
         if x <= 1 and self.base_x != 0:
             pillar = x
             self.base_x = max(self.base_x - 1, 0)
-            self.render()
-        self.move(y,  max(pillar, 0))
+        self._sync().move(y, max(pillar, 0))
 
     def _up(self) -> None:
         _, width = self.size()
@@ -98,11 +398,11 @@ class Canvas(Widget):
         if y <= 1 and self.base_y != 0:
             line = y
             self.base_y = max(self.base_y - 1, 0)
-        sentence = self.buffer[line + self.base_y]
-        if x > len(sentence) - self.base_x:
-            self.base_x = int(len(sentence) / width) * width
-        pillar = min(x, max(len(sentence) - self.base_x, 0))
-        self.render().move(line, pillar)
+        length = self.buffer.length(line + self.base_y)
+        if x > length - self.base_x:
+            self.base_x = int(length / width) * width
+        pillar = min(x, max(length - self.base_x, 0))
+        self._sync().move(line, pillar)
 
     def _down(self) -> None:
         height, width = self.size()
@@ -114,11 +414,11 @@ class Canvas(Widget):
             self.base_y = min(self.base_y + 1, max_shift)
         if line + self.base_y >= len(self.buffer):
             return
-        sentence = self.buffer[line + self.base_y]
-        if x > len(sentence) - self.base_x:
-            self.base_x = int(len(sentence) / width) * width
-        pillar = min(x, max(len(sentence) - self.base_x, 0))
-        self.render().move(line, pillar)
+        length = self.buffer.length(line + self.base_y)
+        if x > length - self.base_x:
+            self.base_x = int(length / width) * width
+        pillar = min(x, max(length - self.base_x, 0))
+        self._sync().move(line, pillar)
 
     def _backspace(self) -> None:
         _, width = self.size()
@@ -130,58 +430,224 @@ class Canvas(Widget):
             pillar = x
             self.base_x = max(self.base_x - 1, 0)
         elif x == 0 and y > 0:
-            row = self.buffer.pop(self.base_y + y)
             line = max(line - 1, 0)
-            sentence = self.buffer[self.base_y + y - 1]
-            self.base_x = int(len(sentence) / width) * width
-            pillar = max(len(sentence) - self.base_x, 0)
-            self.buffer[self.base_y + y - 1] += row
+            length = self.buffer.length(self.base_y + y - 1)
+            self.base_x = int(length / width) * width
+            pillar = max(length - self.base_x, 0)
+            self.buffer.delete(self.base_y + y - 1, length, 1)
+            self._touch(self.base_y + y - 1, -1)
 
-        self.buffer[self.base_y + line] = (
-            self.buffer[self.base_y + line][:max(character - 1, 0)] +
-            self.buffer[self.base_y + line][character:])
+        if 0 < character <= self.buffer.length(self.base_y + line):
+            self.buffer.delete(self.base_y + line, character - 1, 1)
+            self._touch(self.base_y + line)
 
-        self.render().move(line, pillar)
+        self._refresh(line, line - y).move(line, pillar)
 
     def _delete(self) -> None:
         y, x = self.cursor()
-        sentence = self.buffer[self.base_y + y]
-        if (self.base_x + x == len(sentence) and
+        length = self.buffer.length(self.base_y + y)
+        delta = 0
+        if self.base_x + x < length:
+            self.buffer.delete(self.base_y + y, self.base_x + x, 1)
+        elif (self.base_x + x == length and
                 (self.base_y + y) < len(self.buffer) - 1):
-            row = self.buffer.pop(self.base_y + y + 1)
-            self.buffer[self.base_y + y] += row
-        else:
-            self.buffer[self.base_y + y] = (
-                sentence[:self.base_x + x] +
-                sentence[self.base_x + x + 1:])
-        self.render().move(y, x)
+            self.buffer.delete(self.base_y + y, self.base_x + x, 1)
+            delta = -1
+        self._touch(self.base_y + y, delta)
+        self._refresh(y, delta).move(y, x)
 
     def _enter(self) -> None:
         y, x = self.cursor()
-        head, tail = (
-            self.buffer[self.base_y + y][:self.base_x + x],
-            self.buffer[self.base_y + y][self.base_x + x:])
+        self.buffer.write(self.base_y + y, self.base_x + x, '\n')
+        self._touch(self.base_y + y, 1)
         self.base_x = 0
-        self.buffer[self.base_y + y] = head
-        self.buffer.insert(self.base_y + y + 1, tail)
-        self.render().move(y + 1)
+        self._refresh(y, 1).move(y + 1)
 
     def _character(self, data: str) -> None:
         y, x = self.cursor()
         _, width = self.size()
 
-        insertion = data.splitlines()
-        first = insertion and insertion.pop(0) or ''
-        head = self.buffer[self.base_y + y][:self.base_x + x] + first
-        tail = self.buffer[self.base_y + y][self.base_x + x:]
-
-        line = min(self.base_y + y, len(self.buffer) - 1)
-        self.buffer[self.base_y + y] = head + tail
-        self.buffer[line + 1:line + 1] = insertion
+        insertion = '\n'.join(data.splitlines())
+        self.buffer.write(self.base_y + y, self.base_x + x, insertion)
+        self._touch(self.base_y + y, insertion.count('\n'))
 
         x += 1
         if x >= width - 2:
             self.base_x += 1
             x -= 1
 
-        self.render().move(y, x)
+        self._refresh(y, insertion.count('\n')).move(y, x)
+
+    def _wrapped(self, event: Event) -> None:
+        line, column = self._position(*self.cursor())
+        length, key = self.buffer.length(line), ord(event.key)
+        if key == curses.KEY_LEFT:
+            if column:
+                column -= 1
+            elif line:
+                line, column = line - 1, self.buffer.length(line - 1)
+        elif key == curses.KEY_RIGHT:
+            if column < length:
+                column += 1
+            elif line < len(self.buffer) - 1:
+                line, column = line + 1, 0
+        elif key in (curses.KEY_UP, curses.KEY_DOWN):
+            line, column = self._vertical(
+                line, column, -1 if key == curses.KEY_UP else 1)
+        elif key == curses.KEY_BACKSPACE:
+            if column:
+                column -= 1
+                self._erase(line, column)
+            elif line:
+                line, column = line - 1, self.buffer.length(line - 1)
+                self._erase(line, column, -1)
+        elif key == curses.KEY_DC:
+            if column < length:
+                self._erase(line, column)
+            elif line < len(self.buffer) - 1:
+                self._erase(line, column, -1)
+        elif event.key == '\n':
+            self._insert(line, column, '\n')
+            return
+        else:
+            self._insert(line, column, '\n'.join(event.data.splitlines()))
+            return
+
+        self._reveal(line, column)
+
+    def _erase(self, line: int, column: int, delta: int = 0) -> None:
+        self.buffer.delete(line, column, 1)
+        self._touch(line, delta)
+        self._rewrap(line, delta)
+
+    def _insert(self, line: int, column: int, insertion: str) -> 'Canvas':
+        delta = insertion.count('\n')
+        self.buffer.write(line, column, insertion)
+        self._touch(line, delta)
+        self._rewrap(line, delta)
+        if delta:
+            column = len(insertion) - insertion.rfind('\n') - 1
+        else:
+            column += len(insertion)
+        return self._reveal(line + delta, column)
+
+    def _vertical(self, line: int, column: int,
+                  step: int) -> Tuple[int, int]:
+        wrapper = cast(Wrap, self.wrapper)
+        segment = wrapper.locate(line, column)
+        pillar = column - wrapper.segments(line)[segment]
+        target = (wrapper.next(line, segment) if step > 0
+                  else wrapper.previous(line, segment))
+        if not target:
+            return line, column
+
+        line, segment = target
+        start = wrapper.segments(line)[segment]
+        return line, min(start + pillar, wrapper.limit(line, segment))
+
+    def _position(self, y: int, x: int) -> Tuple[int, int]:
+        wrapper = cast(Wrap, self.wrapper)
+        if not self._map:
+            return 0, 0
+        line, segment = self._map[min(y, len(self._map) - 1)]
+        start = wrapper.segments(line)[segment]
+        return line, min(start + x, wrapper.limit(line, segment))
+
+    def _reveal(self, line: int, column: int) -> 'Canvas':
+        wrapper = cast(Wrap, self.wrapper)
+        target = (line, wrapper.locate(line, column))
+        pillar = column - wrapper.segments(line)[target[1]]
+        if target not in self._map or self._painted != self._origin():
+            height, _ = self._viewport()
+            top = target
+            if target > (self.base_y, self.base_segment):
+                for _ in range(height - 1):
+                    top = wrapper.previous(*top) or top
+            if target < (self.base_y, self.base_segment) or (
+                    top > (self.base_y, self.base_segment)):
+                self.base_y, self.base_segment = top
+
+        self._sync()
+        row = self._map.index(target) if target in self._map else 0
+        return self.move(row, pillar)
+
+    def _resize(self, width: int) -> None:
+        wrapper = cast(Wrap, self.wrapper)
+        self._clamp()
+        if wrapper.width == width:
+            return
+        anchor = wrapper.segments(self.base_y)[self.base_segment]
+        wrapper.resize(width)
+        self.base_segment = wrapper.locate(self.base_y, anchor)
+
+    def _clamp(self) -> None:
+        wrapper = cast(Wrap, self.wrapper)
+        self.base_x = 0
+        self.base_y = min(self.base_y, len(self.buffer) - 1)
+        self.base_segment = min(
+            self.base_segment, len(wrapper.segments(self.base_y)) - 1)
+
+    def _scroll(self) -> 'Canvas':
+        wrapper, painted = cast(Wrap, self.wrapper), self._painted
+        if not painted or self._dirty or not self.window:
+            return self._defer()
+
+        top = (self.base_y, self.base_segment)
+        if wrapper.next(painted[0], painted[2]) == top:
+            shift = 1
+        elif wrapper.previous(painted[0], painted[2]) == top:
+            shift = -1
+        else:
+            return self._defer()
+
+        origin = 1 if self.styling.border else 0
+        height, _ = self._viewport()
+        try:
+            self.window.scrollok(True)
+            self.window.setscrreg(origin, origin + height - 1)
+            self.window.scroll(shift)
+            self.window.scrollok(False)
+        except CursesError:
+            return self._defer()
+
+        self._painted = self._origin()
+        rows = wrapper.rows(self.base_y, self.base_segment, height)
+        return self._paint(rows, [height - 1 if shift > 0 else 0])
+
+    def _rewrap(self, line: int, delta: int = 0) -> 'Canvas':
+        wrapper = cast(Wrap, self.wrapper)
+        if (self._dirty or not self.window or
+                self._painted != self._origin()):
+            return self._defer()
+
+        self._clamp()
+        if self._painted != self._origin():
+            return self._defer()
+
+        height, _ = self._viewport()
+        previous = self._map
+        rows = wrapper.rows(self.base_y, self.base_segment, height)
+        return self._paint(rows, [
+            row for row in range(max(len(rows), len(previous)))
+            if row >= len(rows) or row >= len(previous) or
+            rows[row] != previous[row] or rows[row][0] == line or
+            (delta and rows[row][0] > line)])
+
+    def _paint(self, rows: List[Segment], changed: List[int]) -> 'Canvas':
+        wrapper = cast(Wrap, self.wrapper)
+        origin = 1 if self.styling.border else 0
+        _, width = self._viewport()
+        self._map = rows
+        self._view = [wrapper.text(*row) for row in rows]
+        try:
+            for row in changed:
+                sentence = self._view[row] if row < len(rows) else ''
+                self.window.addstr(origin + row, origin,
+                                   sentence.ljust(width - 1),
+                                   self.styling.color)
+                self._highlight(row, row + 1)
+        except CursesError:
+            return self._defer()
+
+        self.window.noutrefresh()
+        return self
@@ -1,12 +1,20 @@
-from typing import Sequence, Type, List, Dict, Union
-from ..widget import Widget
+import curses
+from collections.abc import Mapping
+from typing import (
+    Sequence, Type, List, Dict, Tuple, Union, Optional, Any, cast)
+from ..widget import Widget, CursesError
 from ..style import Style
 from ..event import Event
+from .source import Source, Pager
+from .table import Table
+from .query import Query, Predicate
 
 
 ItemType = Union[List[str], List[Dict[str, str]], List[Sequence[str]]]
 
-DataType = List[ItemType]
+DataType = Union[List[ItemType], Table]
+
+Cells = List[Tuple[str, int, int, int, Style]]
 
 
 class Listbox(Widget):
@@ -23,12 +31,37 @@ class Listbox(Widget):
             'field_template', getattr(self, 'field_template', None))
         self.field_styling: Style = context.pop(
             'field_style', getattr(self, 'field_styling', Style(align='C')))
+        self.field_styles: Dict[str, Style] = context.pop(
+            'field_styles', getattr(self, 'field_styles', {}))
+        self.flat: bool = context.pop('flat', getattr(self, 'flat', False))
+        self.widths: List[int] = context.pop(
+            'widths', getattr(self, 'widths', []))
         self.limit: int = context.pop(
             'limit', getattr(self, 'limit', None))
         self.offset: int = context.pop(
             'offset', getattr(self, 'offset', None))
         self.orientation: str = context.pop(
             'orientation', getattr(self, 'orientation', 'vertical'))
+        self.virtual: bool = context.pop(
+            'virtual', getattr(self, 'virtual', False))
+        self.item_size: int = context.pop(
+            'item_size', getattr(self, 'item_size', 1))
+        self.source: Optional[Source] = context.pop(
+            'source', getattr(self, 'source', None))
+        self.placeholder: Any = context.pop(
+            'placeholder', getattr(self, 'placeholder', None))
+
+        query: Optional[Query] = getattr(self, '_query', None)
+        if query is None or query.data is not self.data:
+            query = Query(self.data)
+        self._query: Query = query
+
+        self._pager: Optional[Pager] = None
+        if self.source:
+            self.virtual = True
+            self._pager = Pager(
+                self.source, context.pop('page_size', 100),
+                context.pop('page_cache', 8), self._on_page)
 
         if context.get('command'):
             self.ignore('click')
@@ -38,8 +71,7 @@ class Listbox(Widget):
         return super().setup(**context, mode=mode) and self
 
     def build(self) -> None:
-        item_constructor = self.template or Listitem
-        items = self.data
+        items = [] if self.virtual else self._query
 
         if self.offset is not None:
             items = items[self.offset:]
@@ -48,32 +80,187 @@ class Listbox(Widget):
             items = items[:self.limit]
 
         for index, item in enumerate(items):
-            coordinates = ((0, index) if self.orientation == 'horizontal'
-                           else (index, 0))
-            item_constructor(
-                self, item=item, fields=self.fields,
-                orientation=self.orientation,
-                style=self.item_styling,
-                field_template=self.field_template,
-                field_style=self.field_styling).grid(*coordinates)
+            self._spawn(index, item)
 
         self.listen('click', self.on_click)
+        self.listen('press', self.on_press)
         self.listen('keydown', self.on_keydown)
 
     async def on_click(self, event: Event) -> None:
         if isinstance(event.target, Widget):
             event.target.focus()
 
+    def settle(self) -> None:
+        if not self.virtual:
+            return
+
+        loss = 2 if self.styling.border else 0
+        height, width = self.size()
+        extent = (width if self.orientation == 'horizontal' else height)
+        capacity = max((extent - loss) // max(self.item_size, 1), 0)
+
+        for row in self.children[capacity:]:
+            self.remove(row)
+        for index in range(len(self.children), capacity):
+            self._spawn(index, None)
+
+        self.limit = capacity
+        self.offset = self._clamp(self.offset or 0)
+        self._bind()
+        self.window.idlok(True)
+
+    def scroll(self, delta: int) -> 'Listbox':
+        offset = self._clamp((self.offset or 0) + delta)
+        shift = offset - (self.offset or 0)
+        self.offset = offset
+        if shift and not self._shift(shift):
+            self._bind()
+            self.request_render()
+        return self
+
+    def _shift(self, shift: int) -> bool:
+        rows = self.children
+        if (self._dirty or not self.window or abs(shift) >= len(rows) or
+                self.orientation == 'horizontal' or not all(
+                    isinstance(row, Listitem) and row.window
+                    for row in rows)):
+            return False
+
+        step = rows[0].height
+        top, bottom = rows[0].y, rows[0].y + step * len(rows) - 1
+        height, _ = self.window.getmaxyx()
+        try:
+            self.window.scrollok(True)
+            self.window.setscrreg(top, bottom)
+            self.window.scroll(shift * step)
+            self.window.setscrreg(0, height - 1)
+            self.window.scrollok(False)
+            if self.styling.border:
+                self.window.bkgdset(' ', self.styling.border_color)
+                self.window.border(*self.styling.border)
+                self.window.bkgdset(' ', self.styling.color)
+        except CursesError:
+            return False
+        self.window.noutrefresh()
+
+        previous = [cast(Listitem, row).item for row in rows]
+        items = self._slice(self.offset or 0, len(rows))
+        for index, row in enumerate(rows):
+            item = items[index] if index < len(items) else None
+            origin = index + shift
+            shown = 0 <= origin < len(rows) and previous[origin] == item
+            cast(Listitem, row).bind(item, not shown)
+
+        return True
+
+    def filter(self, predicate: Optional[Predicate]) -> 'Listbox':
+        self._query.filter(predicate)
+        return self._requery()
+
+    def sort(self, *fields: str, reverse: bool = False) -> 'Listbox':
+        self._query.sort(*fields, reverse=reverse)
+        return self._requery()
+
+    def search(self, field: str, prefix: str) -> 'Listbox':
+        self._query.search(field, prefix)
+        return self._requery()
+
+    def _requery(self) -> 'Listbox':
+        if self.offset is not None:
+            self.offset = 0
+        if not self.virtual:
+            return self._rebind()
+        self._bind()
+        return self.request_render()
+
+    def _rebind(self) -> 'Listbox':
+        offset, total = self.offset or 0, self._total()
+        stop = total if self.limit is None else min(offset + self.limit, total)
+        count = max(stop - offset, 0)
+        for row in self.children[count:]:
+            self.remove(row)
+        for index in range(len(self.children), count):
+            self._spawn(index, None)
+        self._bind()
+        return self.request_render()
+
+    async def load(self) -> None:
+        if not self._pager:
+            return
+        await self._pager.count()
+        self._bind()
+        self.request_render()
+
+    def _on_page(self, number: int) -> None:
+        self._bind()
+        self.request_render()
+
+    def _total(self) -> int:
+        if self._pager:
+            return self._pager.total or 0
+        return len(self._query)
+
+    def _clamp(self, offset: int) -> int:
+        return max(min(offset, self._total() - (self.limit or 0)), 0)
+
+    def _slice(self, offset: int, count: int) -> Sequence[Any]:
+        if not self._pager:
+            return self._query[offset: offset + count]
+
+        placeholder = self.placeholder
+        if placeholder is None:
+            placeholder = ({field: '...' for field in self.fields}
+                           if self.fields else '...')
+
+        stop = min(offset + count, self._total())
+        self._pager.prefetch(offset, stop)
+        return [self._pager.get(index, placeholder)
+                for index in range(offset, stop)]
+
+    def _spawn(self, index: int, item: Any) -> Widget:
+        item_constructor = self.template or Listitem
+        coordinates = ((0, index) if self.orientation == 'horizontal'
+                       else (index, 0))
+        return item_constructor(
+            self, item=item, fields=self.fields,
+            orientation=self.orientation,
+            style=self.item_styling,
+            field_template=self.field_template,
+            field_style=self.field_styling,
+            field_styles=self.field_styles,
+            flat=self.flat, widths=self.widths).grid(*coordinates)
+
+    def _bind(self) -> None:
+        offset = self.offset or 0
+        items = self._slice(offset, len(self.children))
+        for index, row in enumerate(list(self.children)):
+            item = items[index] if index < len(items) else None
+            if isinstance(row, Listitem):
+                row.bind(item)
+            else:
+                self.remove(row)
+                self.add(self._spawn(index, item), index)
+
+    async def on_press(self, event: Event) -> None:
+        if self.virtual and event.button in (4, 5):  # Mouse wheel
+            self.scroll(-1 if event.button == 4 else 1)
+
     async def on_keydown(self, event: Event) -> None:
-        if ord(event.key) == 338 and self.limit:  # Page Down
+        if self.virtual and ord(event.key) in (
+                curses.KEY_UP, curses.KEY_DOWN):
+            self.scroll(-1 if ord(event.key) == curses.KEY_UP else 1)
+        elif self.virtual and ord(event.key) in (338, 339):
+            self.scroll((self.limit or 0) * (1 if ord(event.key) == 338
+                                             else -1))
+        elif ord(event.key) == 338 and self.limit:  # Page Down
             self.offset = (self.offset or 0)
-            delta = (self.limit if len(self.data)
+            delta = (self.limit if len(self._query)
                      - self.offset > self.limit else 0)
             self.offset += delta
-            self.connect()
+            self._rebind()
         elif ord(event.key) == 339 and self.limit:  # Page Up
             self.offset = max((self.offset or 0) - self.limit, 0)
-            self.connect()
+            self._rebind()
 
 
 class Listitem(Widget):
@@ -83,23 +270,101 @@ class Listitem(Widget):
         self.orientation = context.pop('orientation')
         self.field_template = context.pop('field_template')
         self.field_styling = context.pop('field_style')
+        self.field_styles = context.pop('field_styles', {})
+        self.flat = context.pop('flat', False) and not self.field_template
+        self.widths = context.pop('widths', [])
+        self._columns: Tuple[Any, Cells] = (None, [])
         return super().setup(**context) and self
 
     def build(self) -> None:
         if not self.fields:
-            self.content = str(self.item)
+            self.content = '' if self.item is None else str(self.item)
             return
 
-        field_constructor = self.field_template or Widget
-        item = self.item
-        if hasattr(item, '__dict__'):
-            item = vars(item)
+        if self.flat:
+            return
 
-        if not isinstance(item, dict):
-            raise ValueError('Provide a dict or object for field indexing.')
+        field_constructor = self.field_template or Widget
+        item = self._index(self.item)
 
         for index, field in enumerate(self.fields):
             coordinates = ((index, 0) if self.orientation == 'horizontal'
                            else (0, index))
             field_constructor(self, content=item.get(field, ''),
                               style=self.field_styling).grid(*coordinates)
+
+    def bind(self, item: Any, invalidate: bool = True) -> 'Listitem':
+        self.item = item
+        if not self.fields or self.flat:
+            self.content = ('' if item is None or self.fields
+                            else str(item))
+            return self.invalidate() if invalidate else self
+
+        values = self._index(item)
+        for child, field in zip(self.children, self.fields):
+            child.content = values.get(field, '')
+            if invalidate:
+                child.invalidate()
+
+        return self
+
+    def amend(self) -> None:
+        if not (self.flat and self.fields):
+            return
+
+        values = self._index(self.item)
+        for field, y, x, width, style in self._cells():
+            text = style.template.format(values.get(field, ''))[:width]
+            align = style.align[-1:]
+            if align == 'C':
+                text = text.center(width)
+            elif align == 'R':
+                text = text.rjust(width)
+            else:
+                text = text.ljust(width)
+            try:
+                self.window.addstr(y, x, text, style.color)
+            except CursesError:
+                pass  # Writing the bottom right cell moves the cursor out
+
+    def _cells(self) -> Cells:
+        extent = self.window.getmaxyx()
+        if self._columns[0] == extent:
+            return self._columns[1]
+
+        height, width = extent
+        horizontal = self.orientation == 'horizontal'
+        size = height if horizontal else width
+        fixed = [self.widths[index] if index < len(self.widths) else 0
+                 for index in range(len(self.fields))]
+        flexible = fixed.count(0)
+        share, extra = divmod(max(size - sum(fixed), 0), flexible or 1)
+
+        cells: Cells = []
+        offset = 0
+        for field, span in zip(self.fields, fixed):
+            if not span:
+                span, extra = share + (1 if extra > 0 else 0), extra - 1
+            span = max(min(span, size - offset), 0)
+            style = self.field_styles.get(field, self.field_styling)
+            if horizontal:
+                cells.append((field, offset, 0, width, style))
+            else:
+                cells.append((field, (height - 1) // 2, offset, span, style))
+            offset += span
+
+        self._columns = (extent, cells)
+        return cells
+
+    def _index(self, item: Any) -> Mapping:
+        if item is None:
+            return {}
+
+        if hasattr(item, '__dict__'):
+            item = vars(item)
+
+        if not isinstance(item, Mapping):
+            raise ValueError(
+                'Provide a mapping or object for field indexing.')
+
+        return item
@@ -0,0 +1,200 @@
+import asyncio
+import curses
+from collections import deque
+from typing import Any, Deque, List, Tuple
+from ..widget import Widget, CursesError
+from ..event import Event
+
+
+BATCH = 1024
+
+
+class Logview(Widget):
+    def setup(self, **context) -> 'Logview':
+        self.source: Any = context.pop('source', getattr(self, 'source', None))
+        self.capacity: int = context.pop(
+            'capacity', getattr(self, 'capacity', 10000))
+        self.follow: bool = context.pop(
+            'follow', getattr(self, 'follow', True))
+        self.encoding: str = context.pop(
+            'encoding', getattr(self, 'encoding', 'utf-8'))
+        self.chunk: int = context.pop('chunk', getattr(self, 'chunk', 1 << 16))
+
+        self.lines: Deque[str] = deque(maxlen=self.capacity)
+        self.offset = 0
+        self._incoming: Deque[str] = deque(maxlen=self.capacity)
+
+        self.listen('keydown', self.on_keydown)
+        self.listen('press', self.on_press)
+        return super().setup(**context) and self
+
+    async def load(self) -> None:
+        if self.source is None:
+            return
+
+        if isinstance(self.source, asyncio.StreamReader):
+            return await self._consume(self.source)
+
+        count = 0
+        async for line in self.source:
+            self.append(line)
+            count += 1
+            if count % BATCH == 0:
+                await asyncio.sleep(0)
+
+    async def _consume(self, reader: asyncio.StreamReader) -> None:
+        remainder = b''
+        while True:
+            data = await reader.read(self.chunk)
+            if not data:
+                break
+            lines = (remainder + data).split(b'\n')
+            remainder = lines.pop()
+            self.extend(lines)
+            await asyncio.sleep(0)
+
+        if remainder:
+            self.append(remainder)
+
+    def append(self, line: Any) -> 'Logview':
+        return self.extend((line,))
+
+    def extend(self, lines: Any) -> 'Logview':
+        encoding = self.encoding
+        self._incoming.extend(
+            line.decode(encoding, 'replace').rstrip('\r\n')
+            if isinstance(line, bytes) else str(line).rstrip('\r\n')
+            for line in lines)
+        if not self._pending:
+            self._schedule()
+        return self
+
+    def pause(self) -> 'Logview':
+        if self.follow:
+            self.follow = False
+            self.offset = self._bottom()
+        return self
+
+    def resume(self) -> 'Logview':
+        self.follow = True
+        return self.request_render()
+
+    def scroll(self, delta: int) -> 'Logview':
+        self.pause()
+        offset = min(max(self.offset + delta, 0), self._bottom())
+        if offset != self.offset:
+            self.offset = offset
+            self.request_render()
+        return self
+
+    async def on_keydown(self, event: Event) -> None:
+        height, _ = self._viewport()
+        key = ord(event.key)
+        if key == curses.KEY_UP:
+            self.scroll(-1)
+        elif key == curses.KEY_DOWN:
+            self.scroll(1)
+        elif key == curses.KEY_PPAGE:
+            self.scroll(-max(height, 1))
+        elif key == curses.KEY_NPAGE:
+            self.scroll(max(height, 1))
+        elif key == curses.KEY_HOME:
+            self.scroll(-len(self.lines))
+        elif key == curses.KEY_END:
+            self.resume()
+
+    async def on_press(self, event: Event) -> None:
+        if event.button == 4:
+            self.scroll(-1)
+        elif event.button == 5:
+            self.scroll(1)
+
+    def settle(self) -> None:
+        self._collect()
+        if self.follow:
+            self.offset = self._bottom()
+        self.offset = min(self.offset, self._bottom())
+
+    def amend(self) -> None:
+        origin = 1 if self.styling.border else 0
+        height, width = self._viewport()
+        color = self.styling.color
+        for row, line in enumerate(self._visible(height)):
+            self.window.addstr(origin + row, origin,
+                               line[:width - 1], color)
+
+    def _update(self) -> List[Tuple[int, int, int, int]]:
+        if self._dirty or not self._pending:
+            return super()._update()
+
+        self._pending = False
+        if not self.window or not self._incoming:
+            return []
+
+        height, _ = self._viewport()
+        top, total = self.offset, len(self.lines)
+        count = self._collect()
+        dropped = total + count - len(self.lines)
+        if not self.follow:
+            if top >= dropped and top + height <= total:
+                return []
+            self.render()
+        elif count >= height or total < height:
+            self.render()
+        else:
+            try:
+                self._shift(count)
+            except CursesError:
+                self.render()
+
+        return [self._bounds()]
+
+    def _shift(self, count: int) -> None:
+        origin = 1 if self.styling.border else 0
+        height, width = self._viewport()
+        window = self.window
+        window.scrollok(True)
+        window.setscrreg(origin, origin + height - 1)
+        window.scroll(count)
+        window.scrollok(False)
+        if self.styling.border:
+            window.bkgdset(' ', self.styling.border_color)
+            window.border(*self.styling.border)
+            window.bkgdset(' ', self.styling.color)
+
+        self.offset = self._bottom()
+        lines = self.lines
+        color = self.styling.color
+        for row in range(height - count, height):
+            window.addstr(origin + row, origin,
+                          lines[self.offset + row][:width - 1].ljust(
+                              width - 1), color)
+
+        window.noutrefresh()
+
+    def _collect(self) -> int:
+        incoming = self._incoming
+        count = len(incoming)
+        if not count:
+            return 0
+
+        dropped = max(len(self.lines) + count - self.capacity, 0)
+        self.lines.extend(incoming)
+        incoming.clear()
+        if not self.follow:
+            self.offset = max(self.offset - dropped, 0)
+        return count
+
+    def _visible(self, height: int) -> List[str]:
+        lines = self.lines
+        stop = min(self.offset + height, len(lines))
+        return [lines[index] for index in range(self.offset, stop)]
+
+    def _bottom(self) -> int:
+        height, _ = self._viewport()
+        return max(len(self.lines) - height, 0)
+
+    def _viewport(self) -> Tuple[int, int]:
+        origin = 1 if self.styling.border else 0
+        height, width = self.size()
+        return height - 2 * origin, width - 2 * origin
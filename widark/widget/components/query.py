@@ -0,0 +1,162 @@
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+Predicate = Callable[[Any], bool]
+
+
+class Query(Sequence):
+    def __init__(self, data: Sequence) -> None:
+        self.data = data
+        self.predicate: Optional[Predicate] = None
+        self.order: Tuple[Tuple[str, ...], bool] = ((), False)
+        self.prefix: Optional[Tuple[str, str]] = None
+        self.reset()
+
+    def reset(self) -> 'Query':
+        self._orders: Dict[Tuple[Tuple[str, ...], bool], array] = {}
+        self._columns: Dict[str, Sequence] = {}
+        self._range: Optional[Tuple[str, str, int, int]] = None
+        self._result: Optional[array] = None
+        return self._evaluate()
+
+    def filter(self, predicate: Optional[Predicate]) -> 'Query':
+        self.predicate = predicate
+        self._range = None
+        return self._evaluate()
+
+    def sort(self, *fields: str, reverse: bool = False) -> 'Query':
+        self.order = (fields, reverse)
+        self._range = None
+        return self._evaluate()
+
+    def search(self, field: str, prefix: str) -> 'Query':
+        self.prefix = (field, prefix) if prefix else None
+        return self._evaluate()
+
+    @property
+    def active(self) -> bool:
+        return self._result is not None
+
+    def _evaluate(self) -> 'Query':
+        fields, reverse = self.order
+        if not (self.predicate or fields or self.prefix):
+            self._range = self._result = None
+            return self
+
+        if not self.prefix:
+            self._range = None
+            self._result = self._select(
+                self._sorted(fields, reverse) if fields
+                else range(len(self.data)))
+            return self
+
+        field, prefix = self.prefix
+        if self.predicate or fields not in ((), (field,)):
+            self._result = self._narrow(field, prefix)
+            self._range = (field, prefix, 0, 0)
+            return self
+
+        order = self._sorted((field,), reverse)
+        low, high = 0, len(order)
+        if self._range and self._range[0] == field and (
+                prefix.startswith(self._range[1])):
+            low, high = self._range[2:]
+
+        column, size = self._column(field), len(prefix)
+        if reverse:
+            start = _bisect(order, low, high, lambda index:
+                            column[index][:size] > prefix)
+            stop = _bisect(order, start, high, lambda index:
+                           column[index] >= prefix)
+        else:
+            start = _bisect(order, low, high, lambda index:
+                            column[index] < prefix)
+            stop = _bisect(order, start, high, lambda index:
+                           column[index][:size] <= prefix)
+
+        self._range = (field, prefix, start, stop)
+        self._result = (order[start:stop] if fields else
+                        array('Q', sorted(order[start:stop])))
+        return self
+
+    def _narrow(self, field: str, prefix: str) -> array:
+        column = self._column(field)
+        previous = self._range
+        if (previous and self._result is not None and
+                previous[0] == field and prefix.startswith(previous[1])):
+            return array('Q', (index for index in self._result
+                               if column[index].startswith(prefix)))
+
+        fields, reverse = self.order
+        candidates = self._select(
+            self._sorted(fields, reverse) if fields
+            else range(len(self.data)))
+        return array('Q', (index for index in candidates
+                           if column[index].startswith(prefix)))
+
+    def _select(self, indexes: Sequence) -> array:
+        if not self.predicate:
+            return array('Q', indexes)
+        predicate, data = self.predicate, self.data
+        return array('Q', (index for index in indexes
+                           if predicate(data[index])))
+
+    def _sorted(self, fields: Tuple[str, ...], reverse: bool) -> array:
+        key = (fields, reverse)
+        order = self._orders.get(key)
+        if order is None:
+            columns = [self._column(field) for field in fields]
+            if len(columns) == 1:
+                column = columns[0]
+                ranking: Callable = column.__getitem__
+            else:
+                def ranking(index: int) -> Tuple[str, ...]:
+                    return tuple(column[index] for column in columns)
+            order = self._orders[key] = array('Q', sorted(
+                range(len(self.data)), key=ranking, reverse=reverse))
+        return order
+
+    def _column(self, field: str) -> Sequence:
+        column = self._columns.get(field)
+        if column is None:
+            if hasattr(self.data, 'column'):
+                column = getattr(self.data, 'column')(field)
+            else:
+                column = [_value(item, field) for item in self.data]
+            self._columns[field] = column
+        return column
+
+    def __len__(self) -> int:
+        if self._result is None:
+            return len(self.data)
+        return len(self._result)
+
+    def __getitem__(self, index: Any) -> Any:
+        if self._result is None:
+            return self.data[index]
+        if isinstance(index, slice):
+            data = self.data
+            return [data[position] for position in self._result[index]]
+        return self.data[self._result[index]]
+
+
+def _value(item: Any, field: str) -> str:
+    if hasattr(item, '__dict__'):
+        item = vars(item)
+    if isinstance(item, Mapping):
+        value = item.get(field, '')
+        return '' if value is None else str(value)
+    return ''
+
+
+def _bisect(order: array, low: int, high: int,
+            before: Callable[[int], bool]) -> int:
+    while low < high:
+        middle = (low + high) // 2
+        if before(order[middle]):
+            low = middle + 1
+        else:
+            high = middle
+    return low
@@ -0,0 +1,183 @@
+import re
+import time
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Iterable, List, Optional, Tuple, cast
+
+
+Match = Tuple[int, int]
+
+
+class Search:
+    def __init__(self, buffer: Any, pattern: str = '',
+                 regex: bool = False, ignorecase: bool = False,
+                 budget: float = 0.005) -> None:
+        self.buffer = buffer
+        self.budget = budget
+        self.pattern = ''
+        self.regex = regex
+        self.ignorecase = ignorecase
+        self.total = 0
+        self.scanned = 0
+        self._expression: Any = None
+        self._cache: List[Optional[List[Match]]] = []
+        self._hits: List[int] = []
+        self._stale: List[int] = []
+        self.find(pattern, regex, ignorecase)
+
+    def find(self, pattern: str, regex: bool = False,
+             ignorecase: bool = False) -> 'Search':
+        narrowing = (
+            not regex and not self.regex and self.pattern and
+            ignorecase == self.ignorecase and
+            pattern.startswith(self.pattern))
+
+        self.pattern, self.regex, self.ignorecase = (
+            pattern, regex, ignorecase)
+        self._expression = re.compile(
+            pattern if regex else re.escape(pattern),
+            re.IGNORECASE if ignorecase else 0) if pattern else None
+
+        if narrowing and len(self._cache) == len(self.buffer):
+            cache = self._cache
+            for index in self._hits:
+                self.total -= len(cast(List[Match], cache[index]))
+                cache[index] = None
+            self._hits, self._stale = [], []
+        else:
+            self.reset()
+
+        self.scanned = 0
+        return self
+
+    def reset(self, buffer: Any = None) -> 'Search':
+        if buffer is not None:
+            self.buffer = buffer
+        self._cache = [None] * len(self.buffer)
+        self._hits, self._stale = [], []
+        self.total = 0
+        self.scanned = 0
+        return self
+
+    @property
+    def complete(self) -> bool:
+        return self.scanned >= len(self.buffer)
+
+    async def scan(self) -> int:
+        clock = time.perf_counter
+        deadline = clock() + self.budget
+        while not self.complete:
+            stop = min(self.scanned + 1024, len(self.buffer))
+            self._fill(self.scanned, stop)
+            self.scanned = stop
+            if clock() >= deadline:
+                await asyncio.sleep(0)
+                deadline = clock() + self.budget
+        return self.total
+
+    def line(self, index: int) -> List[Match]:
+        matches = self._align()[index]
+        if matches is None:
+            matches = self._fill(index, index + 1)[index]
+        return cast(List[Match], matches)
+
+    def _fill(self, start: int, stop: int) -> List[Optional[List[Match]]]:
+        cache, match = self._align(), self._match
+        found = 0
+        for index, sentence in zip(range(start, stop),
+                                   self.buffer[start:stop]):
+            if cache[index] is None:
+                matches = cache[index] = match(sentence)
+                if matches:
+                    insort(self._hits, index)
+                    found += len(matches)
+        self.total += found
+        return cache
+
+    def _align(self) -> List[Optional[List[Match]]]:
+        cache, total = self._cache, len(self.buffer)
+        if len(cache) < total:
+            cache.extend([None] * (total - len(cache)))
+        elif len(cache) > total:
+            cache = self.reset()._cache
+        return cache
+
+    def invalidate(self, line: int, delta: int = 0) -> 'Search':
+        cache = self._cache
+        stop = line + 1 + max(-delta, 0)
+        count = 1 + max(delta, 0)
+        for matches in cache[line:stop]:
+            if matches:
+                self.total -= len(matches)
+        cache[line:stop] = [None] * count
+
+        stale = range(line, line + count) if line < self.scanned else ()
+        self._hits = _splice(self._hits, line, stop, delta)
+        self._stale = _splice(self._stale, line, stop, delta, stale)
+        if self.scanned >= stop:
+            self.scanned += delta
+        elif self.scanned > line:
+            self.scanned = line + count
+        return self
+
+    def next(self, y: int, x: int, reverse: bool = False
+             ) -> Optional[Tuple[int, int, int]]:
+        total = len(self.buffer)
+        if not self._expression or not total:
+            return None
+
+        if not self.complete:
+            self._fill(self.scanned, total)
+            self.scanned = total
+        for index in self._stale:
+            self.line(index)
+        self._stale = []
+
+        hits = self._hits
+        if reverse:
+            found = self._pick(y, lambda start: start < x, reverse)
+            other = hits[bisect_left(hits, y) - 1] if hits else y
+        else:
+            found = self._pick(y, lambda start: start > x, reverse)
+            other = hits[bisect_right(hits, y) % len(hits)] if hits else y
+        if found or not hits:
+            return found
+        if other == y:
+            return self._pick(
+                y, lambda start: start >= x if reverse else start <= x,
+                reverse)
+        return self._pick(other, lambda start: True, reverse)
+
+    def _pick(self, index: int, accept: Callable[[int], bool],
+              reverse: bool) -> Optional[Tuple[int, int, int]]:
+        matches = self.line(index) if index < len(self._cache) else []
+        for start, end in (matches[::-1] if reverse else matches):
+            if accept(start):
+                return index, start, end
+        return None
+
+    def _match(self, sentence: str) -> List[Match]:
+        expression = self._expression
+        if not expression:
+            return []
+
+        if not (self.regex or self.ignorecase):
+            pattern = self.pattern
+            if pattern not in sentence:
+                return []
+            matches, size = [], len(pattern)
+            start = sentence.find(pattern)
+            while start >= 0:
+                matches.append((start, start + size))
+                start = sentence.find(pattern, start + size)
+            return matches
+
+        return [match.span() for match in expression.finditer(sentence)
+                if match.end() > match.start()]
+
+
+def _splice(indexes: List[int], start: int, stop: int, delta: int,
+            inserted: Iterable[int] = ()) -> List[int]:
+    low, high = bisect_left(indexes, start), bisect_left(indexes, stop)
+    return indexes[:low] + list(inserted) + [
+        index + delta for index in indexes[high:]]
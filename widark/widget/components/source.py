@@ -0,0 +1,71 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+
+class Source:
+    async def count(self) -> int:
+        raise NotImplementedError('Please provide your own data source.')
+
+    async def fetch(self, offset: int, limit: int) -> Sequence[Any]:
+        raise NotImplementedError('Please provide your own data source.')
+
+
+class Pager:
+    def __init__(self, source: Source, size: int = 100, capacity: int = 8,
+                 callback: Optional[Callable[[int], None]] = None) -> None:
+        self.source = source
+        self.size = max(size, 1)
+        self.capacity = max(capacity, 1)
+        self.callback = callback
+        self.total: Optional[int] = None
+        self.pages: 'OrderedDict[int, Sequence[Any]]' = OrderedDict()
+        self.requests: Dict[int, asyncio.Future] = {}
+        self.window = (0, 0)
+
+    async def count(self) -> int:
+        self.total = await self.source.count()
+        return self.total
+
+    def get(self, index: int, default: Any = None) -> Any:
+        number, position = divmod(index, self.size)
+        page = self.pages.get(number)
+        if page is None:
+            self.request(number)
+            return default
+
+        self.pages.move_to_end(number)
+        return page[position] if position < len(page) else default
+
+    def request(self, number: int) -> None:
+        if (number < 0 or number in self.pages or number in self.requests or
+                (self.total is not None and
+                 number * self.size >= self.total)):
+            return
+        self.requests[number] = asyncio.ensure_future(self._load(number))
+
+    def prefetch(self, start: int, stop: int) -> None:
+        first, last = start // self.size, max(stop - 1, start) // self.size
+        self.window = (first - 1, last + 1)
+        for number in range(first - 1, last + 2):
+            self.request(number)
+
+    async def _load(self, number: int) -> None:
+        try:
+            page = await self.source.fetch(number * self.size, self.size)
+        finally:
+            self.requests.pop(number, None)
+
+        self.pages[number] = page
+        self._evict()
+
+        if self.callback:
+            self.callback(number)
+
+    def _evict(self) -> None:
+        low, high = self.window
+        limit = max(self.capacity, high - low + 1)
+        stale = [number for number in self.pages
+                 if not low <= number <= high]
+        for number in stale[:max(len(self.pages) - limit, 0)]:
+            del self.pages[number]
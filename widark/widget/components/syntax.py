@@ -0,0 +1,143 @@
+import re
+import time
+import asyncio
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+Token = Tuple[int, int, int]
+
+UNKNOWN = object()
+
+
+class Tokenizer:
+    initial: Any = None
+
+    def tokenize(self, line: str, state: Any) -> Tuple[List[Token], Any]:
+        raise NotImplementedError('Please provide your own tokenize method.')
+
+
+class RegexTokenizer(Tokenizer):
+    def __init__(self, rules: Sequence[Tuple[str, int]] = (),
+                 blocks: Sequence[Tuple[str, str, int]] = ()) -> None:
+        self.rules = [attribute for _, attribute in rules]
+        self.blocks = [(re.compile(closing), attribute)
+                       for _, closing, attribute in blocks]
+        self._expression = re.compile('|'.join(
+            [f'(?P<r{index}>{pattern})'
+             for index, (pattern, _) in enumerate(rules)] +
+            [f'(?P<b{index}>{opening})'
+             for index, (opening, _, _) in enumerate(blocks)]) or '(?!)')
+
+    def tokenize(self, line: str, state: Any) -> Tuple[List[Token], Any]:
+        tokens: List[Token] = []
+        position = 0
+        if state is not None:
+            position = self._close(line, 0, 0, state, tokens)
+            if position < 0:
+                return tokens, state
+
+        expression = self._expression
+        while position <= len(line):
+            match = expression.search(line, position)
+            if not match:
+                break
+
+            name = match.lastgroup or 'r0'
+            index = int(name[1:])
+            if name[0] == 'b':
+                position = self._close(
+                    line, match.start(), match.end(), index, tokens)
+                if position < 0:
+                    return tokens, index
+                continue
+
+            if match.end() > match.start():
+                tokens.append(
+                    (match.start(), match.end(), self.rules[index]))
+            position = max(match.end(), match.start() + 1)
+
+        return tokens, None
+
+    def _close(self, line: str, start: int, position: int, block: int,
+               tokens: List[Token]) -> int:
+        closing, attribute = self.blocks[block]
+        match = closing.search(line, position)
+        end = match.end() if match else len(line)
+        if end > start:
+            tokens.append((start, end, attribute))
+        return end if match else -1
+
+
+class Syntax:
+    def __init__(self, tokenizer: Tokenizer, buffer: Any,
+                 budget: float = 0.005) -> None:
+        self.tokenizer = tokenizer
+        self.budget = budget
+        self.reset(buffer)
+
+    def reset(self, buffer: Any = None) -> 'Syntax':
+        if buffer is not None:
+            self.buffer = buffer
+        self.tokens: List[Optional[List[Token]]] = [None] * len(self.buffer)
+        self.states: List[Any] = [UNKNOWN] * len(self.buffer)
+        self.frontier = 0
+        return self
+
+    def ensure(self, stop: int) -> 'Syntax':
+        tokens, states = self._align()
+        stop = min(stop, len(tokens))
+        index = self.frontier
+        if index >= stop:
+            return self
+
+        tokenize, buffer = self.tokenizer.tokenize, self.buffer
+        state = states[index - 1] if index else self.tokenizer.initial
+        converged = False
+        for index, sentence in zip(range(index, stop), buffer[index:stop]):
+            if converged and tokens[index] is not None:
+                state = states[index]
+                continue
+            previous = states[index]
+            tokens[index], state = tokenize(sentence, state)
+            states[index] = state
+            converged = state == previous
+
+        self.frontier = stop
+        return self
+
+    async def scan(self, stop: int) -> int:
+        clock = time.perf_counter
+        deadline = clock() + self.budget
+        while self.frontier < min(stop, len(self.buffer)):
+            self.ensure(min(self.frontier + 256, stop))
+            if clock() >= deadline:
+                await asyncio.sleep(0)
+                deadline = clock() + self.budget
+        return self.frontier
+
+    def line(self, index: int) -> List[Token]:
+        self.ensure(index + 1)
+        return self.tokens[index] or []
+
+    def known(self, index: int) -> List[Token]:
+        if index >= self.frontier:
+            return []
+        return self.tokens[index] or []
+
+    def invalidate(self, line: int, delta: int = 0) -> 'Syntax':
+        stop = line + 1 + max(-delta, 0)
+        count = 1 + max(delta, 0)
+        self.tokens[line:stop] = [None] * count
+        self.states[line:stop] = [UNKNOWN] * (count - 1) + [
+            self.states[stop - 1] if stop <= len(self.states) else UNKNOWN]
+        self.frontier = min(self.frontier, line)
+        return self
+
+    def _align(self) -> Tuple[List[Optional[List[Token]]], List[Any]]:
+        tokens, total = self.tokens, len(self.buffer)
+        if len(tokens) < total:
+            tokens.extend([None] * (total - len(tokens)))
+            self.states.extend([UNKNOWN] * (total - len(self.states)))
+        elif len(tokens) > total:
+            tokens = self.reset().tokens
+        return tokens, self.states
@@ -0,0 +1,179 @@
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class Column(Sequence):
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array('Q', [0])
+
+    def append(self, value: Any) -> None:
+        self.data.extend(_text(value).encode('utf-8'))
+        self.offsets.append(len(self.data))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + len(self.offsets) * self.offsets.itemsize
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in
+                    range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Column index out of range.')
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].decode('utf-8')
+
+
+class Category(Column):
+    def __init__(self) -> None:
+        self.pool: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.keys = array('I')
+
+    def append(self, value: Any) -> None:
+        text = _text(value)
+        code = self.codes.get(text)
+        if code is None:
+            code = self.codes[text] = len(self.pool)
+            self.pool.append(sys.intern(text))
+        self.keys.append(code)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.keys) * self.keys.itemsize
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.pool[key] for key in self.keys[index]]
+        return self.pool[self.keys[index]]
+
+
+class View(Sequence):
+    __slots__ = ('column', 'start', 'stop')
+
+    def __init__(self, column: Column, start: int, stop: int) -> None:
+        self.column = column
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in
+                    range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Column index out of range.')
+        return self.column[self.start + index]
+
+
+class Row(Mapping):
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: 'Table', index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, field: str) -> str:
+        return self.table.columns[field][self.index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.table.fields)
+
+    def __len__(self) -> int:
+        return len(self.table.fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Row) and (
+                other.table.columns is self.table.columns):
+            return other.index == self.index
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f'Row({dict(self)!r})'
+
+
+class Table(Sequence):
+    def __init__(self, fields: Sequence, rows: Iterable[Any] = (),
+                 categories: Sequence = ()) -> None:
+        self.fields: List[str] = [sys.intern(field) for field in fields]
+        self.columns: Dict[str, Column] = {
+            field: Category() if field in categories else Column()
+            for field in self.fields}
+        self.start = 0
+        self.stop: Optional[int] = None
+        self.extend(rows)
+
+    def append(self, row: Any) -> 'Table':
+        if self.stop is not None:
+            raise ValueError('Table views are read-only.')
+
+        if hasattr(row, '__dict__'):
+            row = vars(row)
+
+        if isinstance(row, Mapping):
+            for field in self.fields:
+                self.columns[field].append(row.get(field, ''))
+        else:
+            values = list(row)
+            for position, field in enumerate(self.fields):
+                self.columns[field].append(
+                    values[position] if position < len(values) else '')
+
+        return self
+
+    def extend(self, rows: Iterable[Any]) -> 'Table':
+        for row in rows:
+            self.append(row)
+        return self
+
+    def column(self, field: str) -> Sequence:
+        return View(self.columns[field], self.start, self._end())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def _end(self) -> int:
+        if self.stop is not None:
+            return self.stop
+        return len(self.columns[self.fields[0]]) if self.fields else 0
+
+    def __len__(self) -> int:
+        return self._end() - self.start
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [Row(self, position) for position in
+                        range(self.start + start, self.start + stop, step)]
+            view = Table.__new__(Table)
+            view.fields, view.columns = self.fields, self.columns
+            view.start = self.start + start
+            view.stop = self.start + max(stop, start)
+            return view
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Table index out of range.')
+        return Row(self, self.start + index)
+
+
+def _text(value: Any) -> str:
+    return '' if value is None else str(value)
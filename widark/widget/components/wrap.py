@@ -0,0 +1,98 @@
+from bisect import bisect_right
+from typing import Any, List, Optional, Tuple
+
+
+Segment = Tuple[int, int]
+
+
+class Wrap:
+    def __init__(self, buffer: Any, width: int = 0) -> None:
+        self.buffer = buffer
+        self.width = width
+        self.reset()
+
+    def reset(self, buffer: Any = None) -> 'Wrap':
+        if buffer is not None:
+            self.buffer = buffer
+        self._starts: List[Optional[List[int]]] = [None] * len(self.buffer)
+        return self
+
+    def resize(self, width: int) -> 'Wrap':
+        if width != self.width:
+            self.width = width
+            self.reset()
+        return self
+
+    def segments(self, line: int) -> List[int]:
+        starts = self._align()[line]
+        if starts is None:
+            starts = self._starts[line] = _wrap(
+                self.buffer[line], self.width)
+        return starts
+
+    def locate(self, line: int, column: int) -> int:
+        return max(bisect_right(self.segments(line), column) - 1, 0)
+
+    def text(self, line: int, segment: int) -> str:
+        starts = self.segments(line)
+        stop = starts[segment + 1] if segment + 1 < len(starts) else None
+        return self.buffer[line][starts[segment]:stop]
+
+    def limit(self, line: int, segment: int) -> int:
+        starts = self.segments(line)
+        if segment + 1 < len(starts):
+            return starts[segment + 1] - 1
+        return len(self.buffer[line])
+
+    def next(self, line: int, segment: int) -> Optional[Segment]:
+        if segment + 1 < len(self.segments(line)):
+            return line, segment + 1
+        if line + 1 < len(self.buffer):
+            return line + 1, 0
+        return None
+
+    def previous(self, line: int, segment: int) -> Optional[Segment]:
+        if segment > 0:
+            return line, segment - 1
+        if line > 0:
+            return line - 1, len(self.segments(line - 1)) - 1
+        return None
+
+    def rows(self, line: int, segment: int, count: int) -> List[Segment]:
+        rows: List[Segment] = []
+        total = len(self.buffer)
+        while len(rows) < count and line < total:
+            starts = self.segments(line)
+            stop = min(len(starts), segment + count - len(rows))
+            rows.extend((line, index) for index in range(segment, stop))
+            line, segment = line + 1, 0
+        return rows
+
+    def invalidate(self, line: int, delta: int = 0) -> 'Wrap':
+        stop = line + 1 + max(-delta, 0)
+        self._starts[line:stop] = [None] * (1 + max(delta, 0))
+        return self
+
+    def _align(self) -> List[Optional[List[int]]]:
+        starts, total = self._starts, len(self.buffer)
+        if len(starts) < total:
+            starts.extend([None] * (total - len(starts)))
+        elif len(starts) > total:
+            starts = self.reset()._starts
+        return starts
+
+
+def _wrap(sentence: str, width: int) -> List[int]:
+    starts = [0]
+    if width <= 0:
+        return starts
+
+    start = 0
+    while len(sentence) - start > width:
+        stop = start + width
+        space = sentence.rfind(' ', start, stop)
+        if space > start:
+            stop = space + 1
+        starts.append(stop)
+        start = stop
+    return starts
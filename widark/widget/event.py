@@ -31,12 +31,17 @@ T = TypeVar('T', bound='Target')
 
 
 class Target:
+    _topology = 0
+
     def __init__(self) -> None:
         self.parent: Optional['Target'] = None
         self._y_min = 0
         self._x_min = 0
         self._y_max = 0
         self._x_max = 0
+        self._order = 0
+        self._path: List['Target'] = []
+        self._path_version = 0
         self._capture_listeners: Dict[str, List[Handler]] = (
             defaultdict(lambda: []))
         self._bubble_listeners: Dict[str, List[Handler]] = (
@@ -64,43 +69,64 @@ class Target:
             listeners[type].remove(handler)
         return self
 
+    @property
+    def path(self) -> List['Target']:
+        if self._path_version != Target._topology or not self._path:
+            path: List[Target] = []
+            element: Optional[Target] = self
+            while element:
+                path.append(element)
+                element = element.parent
+            self._path = path
+            self._path_version = Target._topology
+        return self._path
+
     async def dispatch(self, event: Event) -> None:
         if event.phase == 'Capture':
-            for listener in self._capture_listeners.get(event.type, []):
-                await listener(event)
-
+            await _notify(self._capture_listeners.get(event.type), event)
         elif event.phase == 'Bubble':
-            for listener in self._bubble_listeners.get(event.type, []):
-                await listener(event)
-
-        elif event.phase == 'Target':
-            for listener in self._capture_listeners.get(event.type, []):
-                await listener(event)
-            if event.bubbles:
-                event.phase = 'Bubble'
-                for element in event.path:
-                    if event.stop:
-                        return
-                    event.current = element
-                    await element.dispatch(event)
-
+            await _notify(self._bubble_listeners.get(event.type), event)
         else:
-            event.phase = 'Capture'
-            if not event.path:
-                path_target: Optional['Target'] = self
-                while path_target:
-                    event.path.append(path_target)
-                    path_target = path_target.parent
+            await self._propagate(event)
 
+    async def _propagate(self, event: Event) -> None:
+        if not event.path:
+            event.path = list(self.path)
+
+        if event.phase != 'Target':
+            event.phase = 'Capture'
             for element in reversed(event.path):
                 if event.stop:
                     return
+                if element is self:
+                    break
+                listeners = element._capture_listeners.get(event.type)
+                if listeners:
+                    event.current = element
+                    await _notify(listeners, event)
+            else:
+                return
+
+        event.current = event.target = self
+        event.phase = 'Target'
+        await _notify(self._capture_listeners.get(event.type), event)
+
+        if not event.bubbles:
+            return
+
+        event.phase = 'Bubble'
+        for element in event.path:
+            if event.stop:
+                return
+            listeners = element._bubble_listeners.get(event.type)
+            if listeners:
                 event.current = element
-                if element == self:
-                    event.phase = 'Target'
-                    event.target = element
+                await _notify(listeners, event)
 
-                await element.dispatch(event)
+
+async def _notify(listeners: Optional[List[Handler]], event: Event) -> None:
+    for listener in list(listeners or []):
+        await listener(event)
 
 
 MOUSE_EVENTS = {
@@ -126,5 +152,7 @@ MOUSE_EVENTS = {
     curses.BUTTON4_RELEASED: (4, 'release'),
     curses.BUTTON4_CLICKED: (4, 'click'),
     curses.BUTTON4_DOUBLE_CLICKED: (4, 'doubleclick'),
-    curses.BUTTON4_TRIPLE_CLICKED: (4, 'tripleclick')
+    curses.BUTTON4_TRIPLE_CLICKED: (4, 'tripleclick'),
+
+    getattr(curses, 'BUTTON5_PRESSED', 0x200000): (5, 'press')
 }
@@ -0,0 +1,35 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple, Iterable, Optional
+from .event import Target
+
+
+class Index:
+    def __init__(self, cell: int = 8) -> None:
+        self.cell = cell
+        self.buckets: Dict[Tuple[int, int], List[Target]] = {}
+
+    def build(self, targets: Iterable[Target]) -> 'Index':
+        cell = self.cell
+        buckets: Dict[Tuple[int, int], List[Target]] = defaultdict(list)
+        for target in targets:
+            if target._y_max <= target._y_min or (
+                    target._x_max <= target._x_min):
+                continue
+            for row in range(target._y_min // cell,
+                             (target._y_max - 1) // cell + 1):
+                for col in range(target._x_min // cell,
+                                 (target._x_max - 1) // cell + 1):
+                    buckets[(row, col)].append(target)
+
+        for bucket in buckets.values():
+            bucket.sort(key=lambda target: target._order, reverse=True)
+
+        self.buckets = dict(buckets)
+        return self
+
+    def query(self, y: int, x: int) -> Optional[Target]:
+        for target in self.buckets.get((y // self.cell, x // self.cell), []):
+            if (target._y_min <= y < target._y_max and
+                    target._x_min <= x < target._x_max):
+                return target
+        return None
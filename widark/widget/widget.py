@@ -3,7 +3,7 @@ from math import ceil, floor
 from curses import setsyx
 from types import SimpleNamespace
 from _curses import error as CursesError
-from typing import List, Dict, Optional, Tuple, Any, TypeVar
+from typing import List, Dict, Optional, Tuple, Iterator, Any, TypeVar
 from contextvars import copy_context
 from .event import Target
 from .style import Style
@@ -11,16 +11,26 @@ from .style import Style
 
 T = TypeVar('T', bound='Widget')
 
+Layout = List[Tuple['Widget', Dict[str, int]]]
+
 
 class Widget(Target):
+    _sequence = 0
+
     def __init__(self, parent: Optional['Widget'], **context) -> None:
         super().__init__()
         self.parent: Optional['Widget'] = parent
         self.children: List['Widget'] = []
         self.window: Any = None
+        self._dirty = True
+        self._pending = False
+        self._derivation: Tuple[Any, int, int, int, int] = (
+            None, 0, 0, 0, 0)
+        self._composition: Optional[Tuple[Any, Layout, Layout]] = None
 
         if self.parent:
             self.parent.children.append(self)
+            self.parent._relayout()
 
         self.setup(**context)
 
@@ -84,18 +94,17 @@ class Widget(Target):
     def clear(self: T) -> T:
         self.children = []
         if self.window:
-            self.window.clear()
+            self.window.erase()
             self.window.noutrefresh()
-        return self
+        return self._relayout()
 
     def render(self: T) -> T:
         if self.parent and self.parent.window:
             try:
-                factory = self.parent.window.derwin
-                self.window = factory(
-                    self.height, self.width, self.y, self.x)
+                self.window = self._derive(self.parent.window)
                 h, w = self.window.getmaxyx()
-                self.pin(self.y, self.x, h, w)
+                self._fit(self.y, self.x, h, w)
+                self._derivation = (self.parent.window, self.y, self.x, h, w)
                 self._y_min, self._x_min = self.window.getbegyx()
                 self._y_max, self._x_max = self._y_min + h, self._x_min + w
             except CursesError:
@@ -104,11 +113,16 @@ class Widget(Target):
         if not self.window:
             return self
 
+        Widget._sequence += 1
+        self._order = Widget._sequence
+
         try:
-            self.window.clear()
+            self.window.erase()
 
             self.settle()
 
+            self._dirty = self._pending = False
+
             self.window.bkgd(' ', self.styling.background_color)
 
             if self.styling.border:
@@ -121,14 +135,14 @@ class Widget(Target):
             self.window.bkgdset(' ', self.styling.color)
             self.window.addstr(y, x, formatted_content, self.styling.color)
 
-            relative_children, fixed_children = self.subtree()
+            layout, arrangement = self._compose()
 
-            for child, dimensions in self.layout(relative_children):
-                child.pin(**dimensions).render()
+            for child, dimensions in layout:
+                child._fit(**dimensions).render()
 
-            for child, dimensions in self.arrange(fixed_children):
+            for child, dimensions in arrangement:
                 if dimensions['height'] and dimensions['width']:
-                    child.pin(**dimensions).render()
+                    child._fit(**dimensions).render()
 
             self.amend()
 
@@ -138,6 +152,71 @@ class Widget(Target):
 
         return self
 
+    def _derive(self, parent_window: Any) -> Any:
+        parent, y, x, height, width = self._derivation
+        if self.window and parent is parent_window and (
+                y, x) == (self.y, self.x):
+            if (height, width) == (self.height, self.width):
+                return self.window
+            try:
+                self.window.resize(self.height, self.width)
+                return self.window
+            except CursesError:
+                pass
+
+        return parent_window.derwin(self.height, self.width, self.y, self.x)
+
+    def update(self: T) -> T:
+        self._update()
+        return self
+
+    def _update(self) -> List[Tuple[int, int, int, int]]:
+        if self._dirty:
+            self.render()
+            return [self._bounds()]
+
+        if not self._pending:
+            return []
+
+        self._pending = False
+        relative_children, fixed_children = self.subtree()
+        damage: List[Tuple[int, int, int, int]] = []
+        for child in relative_children + fixed_children:
+            if not child.window:
+                continue
+            bounds = child._bounds()
+            if child._dirty or any(
+                    _overlap(bounds, area) for area in damage):
+                child.render()
+                damage.append(child._bounds())
+            else:
+                damage.extend(child._update())
+
+        return damage
+
+    def _bounds(self) -> Tuple[int, int, int, int]:
+        return self._y_min, self._x_min, self._y_max, self._x_max
+
+    def invalidate(self: T) -> T:
+        self._dirty = True
+        return self._schedule()
+
+    def _schedule(self: T) -> T:
+        self._pending = True
+        widget: Widget = self
+        while widget.parent and not widget.parent._pending:
+            widget = widget.parent
+            widget._pending = True
+        if not widget.parent:
+            widget._awake()
+        return self
+
+    def _awake(self) -> None:
+        """Custom render notification"""
+
+    def request_render(self: T) -> T:
+        return self.invalidate()
+
     def gather(self) -> None:
         if not self.autoload:
             return
@@ -152,6 +231,11 @@ class Widget(Target):
     def amend(self) -> None:
         """Custom amendment"""
 
+    def descendants(self) -> Iterator['Widget']:
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
     def subtree(self) -> Tuple[List['Widget'], List['Widget']]:
         fixed_children = []
         relative_children = []
@@ -171,7 +255,8 @@ class Widget(Target):
         child.parent = self
         index = len(self.children) if index is None else index
         self.children.insert(index, child)
-        return self
+        Target._topology += 1
+        return self._relayout()
 
     def cursor(self) -> Tuple[int, int]:
         cursor = (0, 0)
@@ -199,11 +284,14 @@ class Widget(Target):
         if child in self.children:
             child.parent, child.window = None, None
             self.children.remove(child)
+            Widget._sequence += 1
+            Target._topology += 1
+            self._relayout()
         return self
 
     def style(self: T, *args, **kwargs) -> T:
         self.styling.configure(*args, **kwargs)
-        return self
+        return self.invalidate()
 
     def mark(self: T, name='', group='') -> T:
         self.name = name or self.name
@@ -211,22 +299,36 @@ class Widget(Target):
         return self
 
     def pin(self: T, y=0, x=0, height=0, width=0) -> T:
+        if self.parent and (self.y, self.x, self.height, self.width) != (
+                y, x, height, width):
+            self.parent._composition = None
+        return self._fit(y, x, height, width)
+
+    def _fit(self: T, y: int, x: int, height: int, width: int) -> T:
         self.y, self.x = y, x
         self.height, self.width = height, width
         return self
 
     def grid(self: T, row=0, col=0) -> T:
         self.row.pos, self.col.pos = row, col
-        return self
+        return self._reflow()
 
     def span(self: T, row=1, col=1) -> T:
         self.row.span, self.col.span = row, col
-        return self
+        return self._reflow()
 
     def weight(self: T, row=1, col=1) -> T:
         self.row.weight, self.col.weight = row, col
+        return self._reflow()
+
+    def _reflow(self: T) -> T:
+        (self.parent or self)._relayout()
         return self
 
+    def _relayout(self: T) -> T:
+        self._composition = None
+        return self.invalidate()
+
     def focus(self: T) -> T:
         if not self.window:
             return self
@@ -259,8 +361,17 @@ class Widget(Target):
 
         return y + origin, x + origin
 
-    def layout(self, children: List['Widget']
-               ) -> List[Tuple['Widget', Dict[str, int]]]:
+    def _compose(self) -> Tuple[Layout, Layout]:
+        key = (self.window.getmaxyx(), bool(self.styling.border), self.mode)
+        if not self._composition or self._composition[0] != key:
+            relative_children, fixed_children = self.subtree()
+            self._composition = (key, self.layout(relative_children),
+                                 self.arrange(fixed_children))
+
+        _, layout, arrangement = self._composition
+        return layout, arrangement
+
+    def layout(self, children: List['Widget']) -> Layout:
         if not self.window or not children:
             return []
 
@@ -282,37 +393,38 @@ class Widget(Target):
         width_split = total_width / sum(cols.values())
         height_split = total_height / sum(rows.values())
 
-        row_indexes, row_weights = {}, {}
+        rounder = floor if self.mode == 'compact' else ceil
+
+        row_indexes, row_offsets, row_totals = {}, [0], [0]
         for j, (y, row_weight) in enumerate(rows.items()):
             row_indexes[y] = j
-            row_weights[j] = row_weight
+            row_offsets.append(
+                row_offsets[-1] + rounder(row_weight * height_split))
+            row_totals.append(row_totals[-1] + row_weight)
 
-        col_indexes, col_weights = {}, {}
+        col_indexes, col_offsets, col_totals = {}, [0], [0]
         for i, (x, col_weight) in enumerate(cols.items()):
             col_indexes[x] = i
-            col_weights[i] = col_weight
+            col_offsets.append(
+                col_offsets[-1] + rounder(col_weight * width_split))
+            col_totals.append(col_totals[-1] + col_weight)
 
         layout = []
-        rounder = floor if self.mode == 'compact' else ceil
         for child in children:
             row_index = row_indexes[child.row.pos]
-            row_span = row_index + child.row.span
+            row_span = min(row_index + child.row.span, len(rows))
             col_index = col_indexes[child.col.pos]
-            col_span = col_index + child.col.span
+            col_span = min(col_index + child.col.span, len(cols))
 
-            y = sum(rounder(row_weights[j] * height_split) for j in
-                    range(row_index)) + row_origin
-            x = sum(rounder(col_weights[i] * width_split) for i in
-                    range(col_index)) + col_origin
+            y = row_offsets[row_index] + row_origin
+            x = col_offsets[col_index] + col_origin
 
             height = rounder(
-                sum(row_weights.get(j, 0) for j in
-                    range(row_index, row_span)) * height_split)
+                (row_totals[row_span] - row_totals[row_index]) * height_split)
             height = height - max(0, height + y - total_height - row_origin)
 
             width = rounder(
-                sum(col_weights.get(i, 0) for i in
-                    range(col_index, col_span)) * width_split)
+                (col_totals[col_span] - col_totals[col_index]) * width_split)
             width = width - max(0, width + x - total_width - col_origin)
 
             layout.append((child, {'y': y, 'x': x,
@@ -320,13 +432,12 @@ class Widget(Target):
 
         return layout
 
-    def arrange(self, children: List['Widget']) -> List[
-            Tuple['Widget', Dict[str, int]]]:
+    def arrange(self, children: List['Widget']) -> Layout:
         if not self.window or not children:
             return []
 
         total_height, total_width = self.window.getmaxyx()
-        arrangement: List[Tuple['Widget', Dict[str, int]]] = []
+        arrangement: Layout = []
         for child in children:
             if child.position != 'fixed':
                 continue
@@ -365,3 +476,9 @@ class Widget(Target):
                 'y': y, 'x': x, 'height': height, 'width': width}))
 
         return arrangement
+
+
+def _overlap(first: Tuple[int, int, int, int],
+             second: Tuple[int, int, int, int]) -> bool:
+    return (first[0] < second[2] and second[0] < first[2] and
+            first[1] < second[3] and second[1] < first[3])